@@ -5,28 +5,28 @@ the salary as per the following conditions:
 (iii) TA is 30% of Basic Salary
 (iv) LIC is deducted: Rs. 500 every month."""
 
+import pandas as pd
+
+from payroll import compute_payroll, format_rupees
+
 Name = input("Enter Employee Name: ")
 ID = input("Enter Employee ID: ")
 Dept = input("Enter Department: ")
 BS = float(input("Enter Basic Salary: "))
 
-DA = 0.92 * BS    
-HRA = 0.58 * BS     
-TA = 0.30 * BS     
-LIC = 500                     
-
-SFL = BS + DA + HRA + TA
-SAL = SFL - LIC
+# Same engine as batch payroll runs (payroll.py): integer paise, default rates
+slip = compute_payroll(pd.DataFrame({"employee_id": [ID], "name": [Name],
+                                     "department": [Dept], "basic": [BS]}))
+rs = {column: format_rupees(slip[column])[0]
+      for column in ("basic", "DA", "HRA", "TA", "LIC", "gross", "net")}
 
 print("Name:", Name)
 print("Employee ID:", ID)
 print("Department:", Dept)
-print("Basic Salary: Rs.", BS)
-print("DA (92%): Rs.", DA)
-print("HRA (58%): Rs.", HRA)
-print("TA (30%): Rs.", TA)
-print("LIC Deduction: Rs.", LIC)
-print("Salary before LIC deduction: Rs.", SFL)
-print("Salary after LIC deduction: Rs.", SAL)
-
-        
\ No newline at end of file
+print("Basic Salary: Rs.", rs["basic"])
+print("DA (92%): Rs.", rs["DA"])
+print("HRA (58%): Rs.", rs["HRA"])
+print("TA (30%): Rs.", rs["TA"])
+print("LIC Deduction: Rs.", rs["LIC"])
+print("Salary before LIC deduction: Rs.", rs["gross"])
+print("Salary after LIC deduction: Rs.", rs["net"])
\ No newline at end of file
@@ -5,21 +5,31 @@ c) Contact number
 d) eMail ID
 Read the details of monthly purchases from Vendor and generate a Annual Purchase/Billing report."""
 
+import sys
+
+from vendor_purchases import MONTHS, Vendor, VendorRegistry, aggregate_logs, print_report
+
+USAGE = 'usage: python "Pra 1 Assignment 2.py" [vendors.csv YEAR purchases.csv [more logs...]]'
+
+if len(sys.argv) > 1:
+    # Every vendor at once from purchase logs
+    if len(sys.argv) < 4 or not sys.argv[2].isdigit():
+        sys.exit(USAGE)
+    registry = VendorRegistry.load(sys.argv[1])
+    totals, _, _ = aggregate_logs(sys.argv[3:], registry, int(sys.argv[2]))
+    for vendor, months in zip(registry.vendors, totals):
+        print_report(vendor, months)
+    sys.exit()
+
 Name=input("Enter Vendor Name: ")
 Year=input("Enter Year of Association: ")
 Contact=input("Enter Contact Number: ")
 Email=input("Enter eMail ID: ")
 
-months=["January","February","March","April","May","June","July","August","September","October","November","December"]
-total = 0
-for month in months:
+months=[]
+for month in MONTHS:
     print("For %s month:" %month)
     amount = float(input("Enter monthly purchase amount: "))
-    total = total + amount
+    months.append(round(amount * 100))
 
-print("\nANNUAL PURCHASE REPORT")
-print("Vendor Name:", Name)
-print("Year of Association:", Year)
-print("Contact Number:", Contact)
-print("Email ID:", Email)
-print("Total Annual Purchase:", total)
+print_report(Vendor("", Name, Year, Contact, Email), months)
\ No newline at end of file
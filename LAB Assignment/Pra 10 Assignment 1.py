@@ -8,10 +8,11 @@ d) Print the Titles of cheapest & costliest book available
 e) Print the list by sorting based on the year of publication
 """
 
-import pandas as pd
+from book_catalogue import BookCatalogue, load_books
 
-# Load CSV file
-df = pd.read_csv("books.csv")
+# Load CSV file (a pickled copy is reused until books.csv changes)
+catalogue = BookCatalogue(load_books("books.csv"))
+df = catalogue.books
 
 # a) Print complete report
 print("Complete Book Report:")
@@ -20,20 +21,20 @@ print(df)
 # b) Books by a given author
 author_name = input("Enter author name: ")
 print("\nBooks by", author_name)
-print(df[df['author'] == author_name])
+print(catalogue.by_author(author_name))
 
 # c) Books by publishing house
 publisher = input("\nEnter publisher name: ")
 print("\nBooks by publisher:", publisher)
-print(df[df['publisher'] == publisher])
+print(catalogue.by_publisher(publisher))
 
 # d) Cheapest and costliest books
 print("\nCheapest Book:")
-print(df[df['price'] == df['price'].min()])
+print(catalogue.cheapest())
 
 print("\nCostliest Book:")
-print(df[df['price'] == df['price'].max()])
+print(catalogue.costliest())
 
 # e) Sort by year
 print("\nBooks sorted by year:")
-print(df.sort_values(by='year'))
\ No newline at end of file
+print(catalogue.sorted_by_year())
\ No newline at end of file
@@ -14,8 +14,12 @@ iii) Calculate and print average value of parameter x, y, and z separately.
 
 """
 
+import sys
+
 import pandas as pd
 
+from diamond_stats import DTYPES, grouped_stats, read_chunks
+
 # Create DataFrame
 data = {
     'carat': [0.23, 0.21, 0.23, 0.29, 0.31],
@@ -30,18 +34,23 @@ data = {
     'z': [2.43, 2.31, 2.31, 2.63, 2.75]
 }
 
-df = pd.DataFrame(data)
+df = pd.DataFrame(data).astype(DTYPES)
 
-print("DataFrame:\n", df)
+if len(sys.argv) > 1:
+    # Full dataset: python "Pra 12 Assignment 1.py" diamonds.csv (read in chunks)
+    mean_price, price_stats, xyz_means = grouped_stats(read_chunks(sys.argv[1]))
+else:
+    print("DataFrame:\n", df)
+    mean_price, price_stats, xyz_means = grouped_stats([df])
 
 # i) Mean price for each cut
 print("\nMean price for each cut:")
-print(df.groupby('cut')['price'].mean())
+print(mean_price)
 
 # ii) Count, min, max price for each cut
 print("\nCount, Min, Max price for each cut:")
-print(df.groupby('cut')['price'].agg(['count', 'min', 'max']))
+print(price_stats)
 
 # iii) Average of x, y, z
 print("\nAverage values of x, y, z:")
-print(df[['x', 'y', 'z']].mean())
\ No newline at end of file
+print(xyz_means)
\ No newline at end of file
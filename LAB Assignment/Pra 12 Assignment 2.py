@@ -8,22 +8,23 @@ b) Print the details of an employee with employee ID given by an end user.
 c) Print the list of all the Developers of Infosys.
 """
 
-import pandas as pd
+from employee_directory import EmployeeDirectory, load_employees
 
-# Read Excel file
-df = pd.read_excel("employee.xlsx")
+# Read Excel file (parsed once, then loaded from a cached copy until it changes)
+directory = EmployeeDirectory(load_employees("employee.xlsx"))
+df = directory.employees
 
 print("Employee Data:\n", df)
 
 # a) Employees in Automotive domain
 print("\nEmployees in Automotive Domain:")
-print(df[df['Department'] == 'Automotive'])
+print(directory.in_department('Automotive'))
 
 # b) Search by Employee ID
 emp_id = int(input("\nEnter Employee ID: "))
 print("\nEmployee Details:")
-print(df[df['Employee ID'] == emp_id])
+print(directory.employee(emp_id))
 
 # c) List of Developers
 print("\nList of Developers:")
-print(df[df['Designation'] == 'Developer'])
\ No newline at end of file
+print(directory.with_designation('Developer'))
\ No newline at end of file
@@ -12,19 +12,11 @@ Grade is 5 if none of the conditions are met
 Construct a program, which will require the user to give values of hardness, carbon content and tensile strength of
 the steel under consideration and output the grade of the steel."""
 
+from steel_grading import grade
+
 Hardness=float(input("Enter Hardness of steel: "))
 Carbon=float(input("Enter Carbon content of steel: "))
 Tensile=float(input("Enter Tensile streangth of steel: "))
 
-if ((Hardness>50) and (Carbon<0.7) and (Tensile>5600)):
-    print("Grade 10")
-elif ((Hardness>50) and (Carbon<0.7)):
-    print("Grade 9")
-elif ((Carbon<0.7) and (Tensile>5600)):
-    print("Grade 8")
-elif ((Hardness>50) and (Tensile>5600)):
-    print("Grade 7")
-elif ((Hardness>50) or (Carbon<0.7) or (Tensile>5600)):
-    print("Grade 6")
-else:
-    print("Grade 5")
\ No newline at end of file
+# Same rules as batch grading of whole production runs (steel_grading.py)
+print("Grade", grade(Hardness, Carbon, Tensile))
\ No newline at end of file
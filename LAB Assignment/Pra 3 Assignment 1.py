@@ -1,3 +1,8 @@
+# Each pattern is a generator of whole rows (see patterns.py), written in blocks
+from patterns import (alphabet, alternating, count_down, count_up, diamond, even_numbers,
+                      inverted, letter_rows, number_line, pyramid, repeat_number, stars,
+                      word_prefixes, write_rows)
+
 #-------------------------------------------------Task 1-------------------------------------------------
 print("Task 1:")
 # 1
@@ -5,67 +10,42 @@ print("Task 1:")
 # 123
 # 1234
 # 12345
-for i in range(1, 6):
-    for j in range(1, i + 1):
-        print(j, end="")
-    print()
-    
-    
+write_rows(count_up(5))
+
 # 1
 # 22
 # 333
 # 4444
 # 55555
-for i in range(1, 6):
-    for j in range(1, i + 1):
-        print(i, end="")
-    print()
-    
+write_rows(repeat_number(5))
+
 # 1
 # 21
 # 321
 # 4321
 # 54321
-for i in range(1, 6):
-    for j in range(i, 0, -1):
-        print(j, end="")
-    print()
+write_rows(count_down(5))
 
 # 1
 # 1 0
 # 1 0 1
 # 1 0 1 0
 # 1 0 1 0 1
-for i in range(1, 6):
-    for j in range(1, i + 1):
-        if j % 2 == 1:
-            print("1", end=" ")
-        else:
-            print("0", end=" ")
-    print()
-    
+write_rows(alternating(5, "1", "0"))
+
 # 2
 # 4 6
 # 8 10 12
 # 14 16 18 20
-row=4
-num=2
-for i in range(1, row + 1):
-    for j in range(1, i + 1):
-        print(num, end=" ")
-        num += 2
-    print()
+write_rows(even_numbers(4))
 
 # *
 # **
 # ***
 # ****
 # *****
-for i in range(1, 6):
-    for j in range(1, i + 1):
-        print("*", end="")
-    print()
-    
+write_rows(stars(5))
+
 #--------------------------------------------------Task 2-------------------------------------------------
 print("Task 2:")
 # A
@@ -73,23 +53,14 @@ print("Task 2:")
 # ABC
 # ABCD
 # ABCDE
-for i in range(65, 70):
-    for j in range(65, i + 1):
-        print(chr(j), end="")
-    print()
-    
+write_rows(alphabet(5))
+
 # *
 # * #
 # * # *
 # * # * #
 # * # * # *
-for i in range(1, 6):
-    for j in range(1, i + 1):
-        if j % 2 == 1:
-            print("*", end=" ")
-        else:
-            print("#", end=" ")
-    print()
+write_rows(alternating(5, "*", "#"))
 
 # P 
 # YY 
@@ -97,47 +68,28 @@ for i in range(1, 6):
 # HHHH
 # OOOOO 
 # NNNNNN
-chars = ['P', 'Y', 'T', 'H', 'O', 'N']
-for i in range(6):
-    for j in range(i + 1):
-        print(chars[i], end="")
-    print()
-    
+write_rows(letter_rows("PYTHON"))
+
 # P 
 # PY 
 # PYT
 # PYTH
 # PYTHO
 # PYTHON
-chars = ['P', 'Y', 'T', 'H', 'O', 'N']
-for i in range(6):
-    for j in range(0, i + 1):
-        print(chars[j], end="")
-    print()
-    
+write_rows(word_prefixes("PYTHON"))
+
 # ----------------------------------------------------Task 3-------------------------------------------------
 print("Task 3:")
 n=int(input("Enter the number: "))
-for i in range(1, n+1):
-    print(i,end=" ")
-print()
+write_rows(number_line(n))
 # ------------------------------------------------------Task 4-------------------------------------------------
 print("Task 4:")
-rows = 5
-for i in range(rows, 0, -1):
-    for j in range(i):
-        print("*", end="")
-    print()
-    
+write_rows(inverted(5))
+
 # ----------------------------------------------------------Task 5-------------------------------------------------
 print("Task 5:")
-for i in range(1, 6):
-    for j in range(5 - i):
-        print(" ", end=" ")
-    for k in range(2 * i - 1):
-        print("*", end=" ")
-    print()
-    
+write_rows(pyramid(5))
+
 # -----------------------------------------------------------Task 6-------------------------------------------------
 print("Task 6:")
 # *
@@ -149,11 +101,7 @@ print("Task 6:")
 # * * *
 # * *
 # * 
-rows = 5
-for i in range(1, rows + 1):
-    print("*"*i)
-for k in range(rows-1,0,-1):
-    print("*"*k)
+write_rows(diamond(5))
 
 # -----------------------------------------------------------Task 7-------------------------------------------------
 print("Task 7:")
@@ -165,12 +113,9 @@ while True:
         break
     print("Invalid input. The first number must be less than the second number.")
 print("Prime numbers between %d and %d are:"%(N1,N2))
-for num in range(N1, N2 + 1):
-    if num > 1:
-        for i in range(2, num):
-            if (num % i) == 0:
-                break
-        else:
-            print(num, end=" ")
+# Segmented sieve (see primes.py) instead of trial division by every i < num
+from primes import primes_between
+for num in primes_between(N1, N2):
+    print(num, end=" ")
         
         
\ No newline at end of file
@@ -2,9 +2,7 @@
 # a) Construct a Python program using NumPy to generate a 4x4 identity matrix.
 
 import numpy as np
-I = np.zeros((4,4))
-for i in range(4):
-    I[i][i] = 1
+I = np.eye(4)
 print(I)
 
 
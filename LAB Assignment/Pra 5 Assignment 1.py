@@ -11,6 +11,8 @@ d) Print Yes if the Tuple contains an integer 5 and No otherwise
 e) Remove the first and last items from the Tuple, sort the remaining items, and print the result."""
 
 
+from price_stats import counting_sort
+
 nums = tuple(map(int, input("Enter integers separated by space: ").split()))
 print("Total number of items:", len(nums))
 print("Last item:", nums[-1])
@@ -22,7 +24,7 @@ else:
     print("No")
 
 if len(nums) > 2:
-    new_tuple = tuple(sorted(nums[1:-1]))
+    new_tuple = counting_sort(nums[1:-1])
     print("After removing first and last & sorting:", new_tuple)
 else:
     print("Not enough elements to remove first and last.")
\ No newline at end of file
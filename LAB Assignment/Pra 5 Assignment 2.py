@@ -12,15 +12,19 @@ d) Print the price list in ascending order
 
 e) Print the number of costliest items sold on the day"""
 
+from price_stats import PriceStats, counting_sort
+
 prices = tuple(map(int, input("Enter item prices separated by space: ").split()))
 
-print("Total items sold:", len(prices))
+# Count, cheapest, costliest and count of costliest in one pass
+stats = PriceStats().update(prices)
+
+print("Total items sold:", stats.count)
 
-print("Cheapest item price:", min(prices))
+print("Cheapest item price:", stats.min)
 
-print("Costliest item price:", max(prices))
+print("Costliest item price:", stats.max)
 
-print("Prices in ascending order:", tuple(sorted(prices)))
+print("Prices in ascending order:", counting_sort(prices))
 
-costliest = max(prices)
-print("Number of costliest items sold:", prices.count(costliest))
\ No newline at end of file
+print("Number of costliest items sold:", stats.max_count)
\ No newline at end of file
@@ -5,19 +5,13 @@ c) Number of Spaces
 d) Number of Lowercase Letters"""
 
 s = input("Enter a string: ")
-vowels = 0
-consonants = 0
-spaces = 0
-lowercase = 0
-for ch in s:
-    if ch.lower() in "aeiou":
-        vowels += 1
-    elif ch.isalpha():
-        consonants += 1
-    if ch == " ":
-        spaces += 1
-    if ch.islower():
-        lowercase += 1
+# Counted in bulk with bytes.translate (see text_stats.py) instead of per-character checks
+from text_stats import string_stats
+stats = string_stats(s)
+vowels = stats["vowels"]
+consonants = stats["consonants"]
+spaces = stats["spaces"]
+lowercase = stats["lowercase"]
 
 print("Number of Vowels:", vowels)
 print("Number of Consonants:", consonants)
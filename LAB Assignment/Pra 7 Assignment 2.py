@@ -3,31 +3,19 @@ a) Display the current Balance
 b) Mechanism to Deposit an amount
 c) Mechanism to Withdraw an amount"""
 
-class BankAccount:
-    def __init__(self):
-        self.balance = 0
+from bank_ledger import BankAccount, Ledger
 
-    def display(self):
-        print("Current Balance:", self.balance)
+# Transactions are logged to bank_ledger.log; the balance is restored from it on restart
+ledger = Ledger("bank_ledger.log")
 
-    def deposit(self, amount):
-        self.balance += amount
-        print("Amount Deposited.")
-
-    def withdraw(self, amount):
-        if amount <= self.balance:
-            self.balance -= amount
-            print("Amount Withdrawn.")
-        else:
-            print("Insufficient Balance.")
-
-account = BankAccount()
+account = BankAccount(ledger)
 
 while True:
     print("\n1.Display  2.Deposit  3.Withdraw  4.Exit")
     ch = int(input("Enter choice: "))
 
     if ch == 4:
+        ledger.close()
         break
     elif ch == 1:
         account.display()
@@ -2,12 +2,9 @@
 a) Construct a program that reads a text file and writes its contents into a new text file with the same content,
 but in uppercase."""
 
-f1 = open("input.txt", "r")
-data = f1.read()
-f1.close()
+# Streamed in fixed-size pieces (see file_transform.py) instead of reading the whole file
+from file_transform import transform_file, uppercase
 
-f2 = open("output.txt", "w")
-f2.write(data.upper())
-f2.close()
+transform_file("input.txt", "output.txt", [uppercase])
 
 print("Content copied in uppercase.")
\ No newline at end of file
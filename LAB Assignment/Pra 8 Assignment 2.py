@@ -2,17 +2,21 @@
 
 source = input("Enter source file name: ")
 dest = input("Enter destination file name: ")
-f1 = open(source, "r")
-f2 = open(dest, "w")
-for line in f1:
-    if not line.strip().startswith("#"):   
-        f2.write(line)
+# Comments found with the tokenize module, so '#' inside strings is kept
+# and trailing comments are removed too (see file_transform.py)
+import sys
+import tokenize
 
-f1.close()
-f2.close()
+from file_transform import transform_file, strip_comments, print_file
+
+try:
+    transform_file(source, dest, [strip_comments])
+except (tokenize.TokenError, SyntaxError) as e:
+    print("Cannot remove comments: %s is not valid Python (%s)" % (source, e))
+    sys.exit(1)
 print()
 print("\nSource File Content:\n")
-print(open(source).read())
+print_file(source)
 
 print("\nDestination File Content:\n")
-print(open(dest).read())
\ No newline at end of file
+print_file(dest)
\ No newline at end of file
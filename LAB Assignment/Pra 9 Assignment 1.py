@@ -3,31 +3,21 @@ Create a class Employee inherits it into another class Manager. Add methods to g
 """
 
 
-class Employee:
-    def getData(self):
-        self.name = input("Enter Name: ")
-        self.age = int(input("Enter Age: "))
-        self.salary = float(input("Enter Salary: "))
-        self.address = input("Enter Address: ")
-
-    def display(self):
-        print("Name:", self.name)
-        print("Age:", self.age)
-        print("Salary:", self.salary)
-        print("Address:", self.address)
-
-
-class Manager(Employee):
-    pass
+import sys
 
+from employee_records import Manager, load_managers
 
 managers = []
 
-for i in range(10):
-    print("\nEnter details of Manager", i+1)
-    m = Manager()
-    m.getData()
-    managers.append(m)
+if len(sys.argv) > 1:
+    # Bulk load: python "Pra 9 Assignment 1.py" managers.csv (or .jsonl)
+    managers = load_managers(sys.argv[1])
+else:
+    for i in range(10):
+        print("\nEnter details of Manager", i+1)
+        m = Manager()
+        m.getData()
+        managers.append(m)
 
 print("\nManager Information")
 for i in managers:
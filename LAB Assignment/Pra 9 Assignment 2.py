@@ -9,67 +9,50 @@ c) Create a menu-driven interface for the library management system.
    
 """
 
-class Book:
-    def __init__(self, title):
-        self.title = title
-        self.available = True
+# Book, Member and Library live in library_catalogue.py: books are indexed by
+# title/ISBN, can have several copies, and are saved in library.db
+from library_catalogue import Library, LibraryError
 
-
-class Library:
-    def __init__(self):
-        self.books = []
-
-    def add_book(self):
-        name = input("Enter book name: ")
-        b = Book(name)
-        self.books.append(b)
-        print("Book added successfully")
-
-    def show_books(self):
-        print("\nBooks in Library:")
-        for b in self.books:
-            status = "Available" if b.available else "Issued"
-            print(b.title, "-", status)
-
-    def issue_book(self):
-        name = input("Enter book name to issue: ")
-        for b in self.books:
-            if b.title == name and b.available:
-                b.available = False
-                print("Book issued")
-                return
-        print("Book not available")
-
-    def return_book(self):
-        name = input("Enter book name to return: ")
-        for b in self.books:
-            if b.title == name:
-                b.available = True
-                print("Book returned")
-                return
-        print("Book not found")
-
-
-lib = Library()
+lib = Library("library.db")
 
 while True:
     print("\n1.Add Book")
     print("2.Show Books")
     print("3.Issue Book")
     print("4.Return Book")
-    print("5.Exit")
+    print("5.Add Member")
+    print("6.Exit")
 
     ch = int(input("Enter choice: "))
 
-    if ch == 1:
-        lib.add_book()
-    elif ch == 2:
-        lib.show_books()
-    elif ch == 3:
-        lib.issue_book()
-    elif ch == 4:
-        lib.return_book()
-    elif ch == 5:
-        break
-    else:
-        print("Invalid choice")
\ No newline at end of file
+    try:
+        if ch == 1:
+            name = input("Enter book name: ")
+            copies = int(input("Enter number of copies: ") or 1)
+            lib.add_book(name, copies=copies)
+            print("Book added successfully")
+        elif ch == 2:
+            print("\nBooks in Library:")
+            for b in lib.books.values():
+                status = "Available" if b.available else "Issued"
+                print(b.title, "-", status, "(%d of %d copies available)" % (b.available, b.copies))
+        elif ch == 3:
+            name = input("Enter book name to issue: ")
+            member_id = input("Enter member ID: ")
+            lib.issue_book(name, member_id)
+            print("Book issued")
+        elif ch == 4:
+            name = input("Enter book name to return: ")
+            member_id = input("Enter member ID: ")
+            lib.return_book(name, member_id)
+            print("Book returned")
+        elif ch == 5:
+            member = lib.add_member(input("Enter member name: "))
+            print("Member added with ID", member.member_id)
+        elif ch == 6:
+            lib.close()
+            break
+        else:
+            print("Invalid choice")
+    except LibraryError as e:
+        print(e)
@@ -25,14 +25,9 @@ import numpy as np
 
 votes = np.array(list(map(int, input("Enter votes: ").split())))
 
-count = np.zeros(5, dtype=int)
-spoilt = 0
-
-for vote in votes:
-    if 1 <= vote <= 5:
-        count[vote-1] += 1
-    else:
-        spoilt += 1
+# One np.bincount over all ballots (see ballot_counter.py) instead of a Python loop
+from ballot_counter import count_ballots
+count, spoilt = count_ballots(votes, candidates=5)
 
 print("Votes:", count)
 print("Spoilt Ballots:", spoilt)
@@ -61,27 +56,15 @@ for i in range(n):
     arr.append(int(input()))
 
 
-min_diff = abs(arr[0] - arr[1])
-max_diff = abs(arr[0] - arr[1])
-
-min_pair = (arr[0], arr[1])
-max_pair = (arr[0], arr[1])
-
-
-for i in range(n):
-    for j in range(i + 1, n):
-        diff = abs(arr[i] - arr[j])
-
-        if diff < min_diff:
-            min_diff = diff
-            min_pair = (arr[i], arr[j])
-
-        if diff > max_diff:
-            max_diff = diff
-            max_pair = (arr[i], arr[j])
+# Sort + adjacent differences (see pair_difference.py) instead of checking every pair
+from pair_difference import min_max_difference_pairs
 
-print("Pair with minimum difference:", min_pair, "Difference =", min_diff)
-print("Pair with maximum difference:", max_pair, "Difference =", max_diff)
+if n < 2:
+    print("At least 2 elements are needed to form a pair")
+else:
+    (min_pair, min_diff), (max_pair, max_diff) = min_max_difference_pairs(arr)
+    print("Pair with minimum difference:", min_pair, "Difference =", min_diff)
+    print("Pair with maximum difference:", max_pair, "Difference =", max_diff)
 
 # ----------------------------------------------------Q4-----------------------------------------
 # Write a NumPy program to find the set difference between two arrays. The set difference will return sorted, distinct values in arrayl that are not in array2.
@@ -94,11 +77,9 @@ print("Pair with maximum difference:", max_pair, "Difference =", max_diff)
 import numpy as np
 array1 = np.array([0, 10, 20, 40, 60, 80])
 array2 = np.array([10, 30, 40, 50, 70, 90])
-set_diff = []
-for element in array1:
-    if element not in array2:
-        set_diff.append(element)
-set_diff = np.array(set_diff)
+# Vectorised set difference (see set_ops.py) instead of scanning array2 per element
+from set_ops import difference
+set_diff = difference(array1, array2)
 print('set difference between two arrays:', set_diff)
 
 # ----------------------------------------------------Q5-----------------------------------------
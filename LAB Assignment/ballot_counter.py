@@ -0,0 +1,157 @@
+"""Count election ballots: votes per candidate plus spoilt ballots.
+
+A ballot is valid when it holds a candidate number from 1 to N; anything
+else is a spoilt ballot. Each chunk of ballots is counted with a single
+np.bincount, so memory stays constant however many ballots there are, and
+large files can be split across worker processes whose partial counts are
+simply added together.
+
+Ballot files can be text (numbers separated by spaces/newlines), .npy, or
+raw binary integers (``--dtype int8`` etc.).
+
+    python ballot_counter.py ballots.txt --candidates 5 --workers 4
+"""
+
+import argparse
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+CHUNK_BYTES = 64 * 2**20
+# Text is split into one bytes object per ballot, so read it in smaller pieces
+TEXT_CHUNK_BYTES = 8 * 2**20
+INTEGER = re.compile(rb"[+-]?[0-9]{1,18}")
+
+
+def count_ballots(votes, candidates=5):
+    """Return (count, spoilt) for an array of ballots.
+
+    ``count[i]`` is the number of votes for candidate i + 1.
+    """
+    votes = np.asarray(votes)
+    valid = (votes >= 1) & (votes <= candidates)
+    # Spoilt ballots are sent to bin 0, candidate k to bin k
+    bins = np.bincount(np.where(valid, votes, 0).astype(np.intp, copy=False),
+                       minlength=candidates + 1)
+    return bins[1:], int(bins[0])
+
+
+def _merge(results, candidates):
+    count = np.zeros(candidates, dtype=np.int64)
+    spoilt = 0
+    for part_count, part_spoilt in results:
+        count += part_count
+        spoilt += part_spoilt
+    return count, spoilt
+
+
+def _parse_text(data):
+    """Integers from a block of whitespace separated text.
+
+    Any token that is not a plain integer ("2.5", "abc", "+-5") becomes 0,
+    a spoilt ballot.
+    """
+    tokens = data.split()
+    if not tokens:
+        return np.empty(0, dtype=np.int64)
+    # Fast path only when nothing but digits and signs is present, so NumPy
+    # never gets the chance to read "2.5" as 2
+    if not data.translate(None, b"0123456789+- \t\n\r\x0b\x0c"):
+        try:
+            return np.array(tokens).astype(np.int64)
+        except (ValueError, OverflowError):
+            pass
+    return np.array([int(t) if INTEGER.fullmatch(t) else 0 for t in tokens], dtype=np.int64)
+
+
+def _count_text_range(path, start, end, candidates):
+    """Count the ballots whose text starts inside the byte range [start, end)"""
+    results = []
+    with open(path, "rb") as f:
+        if start > 0:
+            # Skip a number that started in the previous range
+            f.seek(start - 1)
+            if not f.read(1).isspace():
+                while True:
+                    ch = f.read(1)
+                    if not ch or ch.isspace():
+                        break
+        pos = f.tell()
+        tail = b""
+        while pos < end:
+            data = f.read(min(TEXT_CHUNK_BYTES, end - pos))
+            if not data:
+                break
+            pos += len(data)
+            data = tail + data
+            cut = max(data.rfind(b" "), data.rfind(b"\n"), data.rfind(b"\t"), data.rfind(b"\r"))
+            if cut == -1:
+                tail = data
+                continue
+            tail = data[cut + 1:]
+            results.append(count_ballots(_parse_text(data[:cut]), candidates))
+        # Finish a number that runs past the end of the range
+        while tail:
+            ch = f.read(1)
+            if not ch or ch.isspace():
+                break
+            tail += ch
+        results.append(count_ballots(_parse_text(tail), candidates))
+    return _merge(results, candidates)
+
+
+def _count_array_range(path, start, end, candidates, dtype):
+    """Count ballots [start, end) of a .npy or raw binary file"""
+    if path.endswith(".npy"):
+        ballots = np.load(path, mmap_mode="r")
+    else:
+        ballots = np.memmap(path, dtype=dtype, mode="r")
+    step = max(1, CHUNK_BYTES // ballots.itemsize)
+    return _merge((count_ballots(ballots[i:min(i + step, end)], candidates)
+                   for i in range(start, end, step)), candidates)
+
+
+def count_ballot_file(path, candidates=5, workers=1, dtype=None):
+    """Count a ballot file, optionally split across worker processes"""
+    if path.endswith(".npy") or dtype is not None:
+        if path.endswith(".npy"):
+            total = np.load(path, mmap_mode="r").shape[0]
+        else:
+            total = os.path.getsize(path) // np.dtype(dtype).itemsize
+        func, extra = _count_array_range, (dtype,)
+    else:
+        total = os.path.getsize(path)
+        func, extra = _count_text_range, ()
+
+    parts = max(1, workers)
+    bounds = [total * i // parts for i in range(parts + 1)]
+    jobs = [(path, bounds[i], bounds[i + 1], candidates) + extra for i in range(parts)]
+    if workers <= 1:
+        return _merge((func(*job) for job in jobs), candidates)
+    with ProcessPoolExecutor(workers) as pool:
+        futures = [pool.submit(func, *job) for job in jobs]
+        return _merge((f.result() for f in futures), candidates)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count votes and spoilt ballots")
+    parser.add_argument("path", help="ballot file (.txt, .npy or raw binary with --dtype)")
+    parser.add_argument("--candidates", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--dtype", help="element type of a raw binary file, e.g. int8")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count, spoilt = count_ballot_file(args.path, args.candidates, args.workers, args.dtype)
+    elapsed = time.perf_counter() - start
+
+    for candidate, votes in enumerate(count, start=1):
+        print("Candidate %d: %d" % (candidate, votes))
+    print("Spoilt Ballots:", spoilt)
+    total = int(count.sum()) + spoilt
+    print("Counted %d ballots in %.2f s (%.1f M ballots/s)"
+          % (total, elapsed, total / elapsed / 1e6 if elapsed else 0))
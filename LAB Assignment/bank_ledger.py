@@ -0,0 +1,258 @@
+"""Thread-safe ledger of bank accounts backed by an append-only transaction log.
+
+Each account has its own lock, so deposits and withdrawals on different
+accounts run in parallel. Every accepted transaction is appended to the log
+while its account lock is held (so the log order matches the order the
+balance changed) and a background writer thread commits whatever has queued
+up in one write + fsync: a "group commit". Callers wait until their own
+transaction is on disk before returning.
+
+Balances are never stored: opening a Ledger replays the log. If writing the
+log fails (e.g. disk full) the ledger is marked failed: waiting callers and
+every later transaction raise LedgerError, since the in-memory balances are
+ahead of the log; reopen the ledger to get the logged balances back. Amounts are
+integers (e.g. paise) so the log and the balances agree exactly, and account
+ids are single words, one field of a log line.
+
+    ledger = Ledger("bank.log")
+    ledger.deposit("ACC1", 500)
+    ledger.withdraw("ACC1", 200)
+    print(ledger.balance("ACC1"))
+
+Run ``python bank_ledger.py`` for a multi-threaded stress test.
+"""
+
+import numbers
+import os
+import random
+import threading
+import time
+
+
+class InsufficientBalance(Exception):
+    pass
+
+
+class LedgerError(Exception):
+    pass
+
+
+class Ledger:
+    def __init__(self, path=None, fsync=True):
+        self.path = path
+        self.fsync = fsync
+        self.balances = {}
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+        self._cond = threading.Condition()
+        self._pending = []
+        self._seq = 0
+        self._committed = 0
+        self._closed = False
+        self._error = None
+
+        self._log = None
+        if path is not None:
+            self._replay()
+            self._log = open(path, "a", encoding="ascii")
+            self._writer = threading.Thread(target=self._write_loop, daemon=True)
+            self._writer.start()
+
+    def _replay(self):
+        """Rebuild balances from the log; a torn last line (crash) is ignored"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="ascii") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                account, kind, amount = line.split()
+                amount = int(amount)
+                if kind == "W":
+                    amount = -amount
+                self.balances[account] = self.balances.get(account, 0) + amount
+
+    def _lock(self, account):
+        lock = self._locks.get(account)
+        if lock is None:
+            with self._locks_guard:
+                lock = self._locks.setdefault(account, threading.Lock())
+        return lock
+
+    def _append(self, account, kind, amount):
+        """Queue a log record; called with the account lock held"""
+        with self._cond:
+            self._seq += 1
+            self._pending.append("%s %s %d\n" % (account, kind, amount))
+            self._cond.notify_all()
+            return self._seq
+
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._closed:
+                    return
+                batch, self._pending = self._pending, []
+                last = self._seq
+
+            try:
+                self._log.write("".join(batch))
+                self._log.flush()
+                if self.fsync:
+                    os.fsync(self._log.fileno())
+            except Exception as e:
+                with self._cond:
+                    self._error = e
+                    self._cond.notify_all()
+                return
+
+            with self._cond:
+                self._committed = last
+                self._cond.notify_all()
+
+    def _wait(self, seq):
+        if self._log is None:
+            return
+        with self._cond:
+            while self._committed < seq and self._error is None:
+                self._cond.wait()
+        if self._committed < seq:
+            self._raise_failed()
+
+    def _raise_failed(self):
+        raise LedgerError("Writing the transaction log failed (%s); reopen the ledger"
+                          % self._error) from self._error
+
+    def balance(self, account):
+        return self.balances.get(account, 0)
+
+    @staticmethod
+    def _check(account, amount, what):
+        if (not isinstance(account, str) or not account.isascii()
+                or len(account.split()) != 1 or account.strip() != account):
+            raise ValueError("Account id must be one ASCII word without spaces: %r" % (account,))
+        if not isinstance(amount, numbers.Integral) or isinstance(amount, bool):
+            raise TypeError("%s amount must be an integer, not %s" % (what, type(amount).__name__))
+        if amount <= 0:
+            raise ValueError("%s amount must be positive" % what)
+        return int(amount)
+
+    def deposit(self, account, amount):
+        amount = self._check(account, amount, "Deposit")
+        if self._error is not None:
+            self._raise_failed()
+        with self._lock(account):
+            self.balances[account] = self.balances.get(account, 0) + amount
+            seq = self._append(account, "D", amount)
+        self._wait(seq)
+        return self.balances[account]
+
+    def withdraw(self, account, amount):
+        amount = self._check(account, amount, "Withdrawal")
+        if self._error is not None:
+            self._raise_failed()
+        with self._lock(account):
+            balance = self.balances.get(account, 0)
+            if amount > balance:
+                raise InsufficientBalance("Insufficient Balance.")
+            self.balances[account] = balance - amount
+            seq = self._append(account, "W", amount)
+        self._wait(seq)
+        return self.balances[account]
+
+    def close(self):
+        """Commit everything still queued and close the log"""
+        if self._log is None:
+            return
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join()
+        try:
+            self._log.close()
+        except OSError:
+            # Already reported by the failed writer
+            if self._error is None:
+                raise
+        self._log = None
+
+
+class BankAccount:
+    """One account of a Ledger with the menu methods of Pra 7 Assignment 2"""
+
+    def __init__(self, ledger=None, account="default"):
+        self.ledger = ledger if ledger is not None else Ledger()
+        self.account = account
+
+    @property
+    def balance(self):
+        return self.ledger.balance(self.account)
+
+    def display(self):
+        print("Current Balance:", self.balance)
+
+    def deposit(self, amount):
+        try:
+            self.ledger.deposit(self.account, amount)
+            print("Amount Deposited.")
+        except (ValueError, TypeError) as e:
+            print(e)
+
+    def withdraw(self, amount):
+        try:
+            self.ledger.withdraw(self.account, amount)
+            print("Amount Withdrawn.")
+        except InsufficientBalance:
+            print("Insufficient Balance.")
+        except (ValueError, TypeError) as e:
+            print(e)
+
+
+def stress_test(path="stress_ledger.log", threads=16, ops_per_thread=5000, accounts=50):
+    """Random deposits/withdrawals from many threads, then check every balance"""
+    if os.path.exists(path):
+        os.remove(path)
+    ledger = Ledger(path)
+    names = ["ACC%d" % i for i in range(accounts)]
+    net = [dict.fromkeys(names, 0) for _ in range(threads)]
+
+    def worker(t):
+        rng = random.Random(t)
+        for _ in range(ops_per_thread):
+            account = rng.choice(names)
+            amount = rng.randint(1, 1000)
+            if rng.random() < 0.6:
+                ledger.deposit(account, amount)
+                net[t][account] += amount
+            else:
+                try:
+                    ledger.withdraw(account, amount)
+                    net[t][account] -= amount
+                except InsufficientBalance:
+                    pass
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    ledger.close()
+
+    expected = {name: sum(n[name] for n in net) for name in names}
+    replayed = Ledger(path)
+    assert all(ledger.balance(name) == expected[name] for name in names)
+    assert all(replayed.balance(name) == expected[name] for name in names)
+    assert all(balance >= 0 for balance in expected.values())
+    total = threads * ops_per_thread
+    print("%d transactions from %d threads in %.2f s (%.0f tx/s); balances exact after replay"
+          % (total, threads, elapsed, total / elapsed))
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    stress_test()
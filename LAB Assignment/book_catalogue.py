@@ -0,0 +1,165 @@
+"""Query layer over books.csv for Pra 10 Assignment 1.
+
+The CSV (title, author, edition, year, publisher, price) is parsed once with
+categorical author/publisher columns, and the resulting DataFrame is pickled
+next to it. Later runs load the pickle unless the CSV's mtime or size has
+changed.
+
+A BookCatalogue builds its indexes once:
+
+    author / publisher  -> row positions (groupby indices)
+    cheapest / costliest -> rows found with nsmallest/nlargest (ties kept)
+    by year             -> a stable sort order
+
+so a query is a dictionary lookup plus an iloc gather of just the matching
+rows, and the last few answers are cached, so repeated interactive queries
+on a 5M-row catalogue take microseconds.
+
+    catalogue = BookCatalogue(load_books("books.csv"))
+    print(catalogue.by_author("R.K. Narayan"))
+
+Run ``python book_catalogue.py`` for a benchmark on a synthetic catalogue.
+"""
+
+import os
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+
+
+DTYPES = {"author": "category", "publisher": "category"}
+RESULT_CACHE_SIZE = 256
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def load_books(path="books.csv", cache=None):
+    """Read the catalogue, using the pickled copy while the CSV is unchanged"""
+    cache = cache or path + ".pkl"
+    stamp = _stamp(path)
+    try:
+        with open(cache, "rb") as f:
+            cached = pickle.load(f)
+        if cached["stamp"] == stamp:
+            return cached["books"]
+    except (OSError, EOFError, KeyError, pickle.UnpicklingError):
+        pass
+
+    books = pd.read_csv(path, dtype=DTYPES)
+    books.columns = books.columns.str.strip()
+    tmp = cache + ".tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump({"stamp": stamp, "books": books}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, cache)
+    return books
+
+
+class BookCatalogue:
+    def __init__(self, books):
+        self.books = books.reset_index(drop=True)
+        self._indexes = {"author": self._index("author"),
+                         "publisher": self._index("publisher")}
+        self._results = {}
+        self._cheapest = None
+        self._costliest = None
+        self._by_year = None
+
+    def _index(self, column):
+        """Value -> row positions, built with one groupby"""
+        if column not in self.books:
+            return {}
+        return self.books.groupby(column, observed=True, sort=False).indices
+
+    def _rows(self, positions):
+        return self.books.iloc[positions]
+
+    def _lookup(self, column, value):
+        """Rows with column == value; recent answers are kept for repeat queries"""
+        key = (column, value)
+        result = self._results.get(key)
+        if result is None:
+            if len(self._results) >= RESULT_CACHE_SIZE:
+                self._results.pop(next(iter(self._results)))
+            result = self._rows(self._indexes[column].get(value, []))
+            self._results[key] = result
+        return result
+
+    def by_author(self, author):
+        return self._lookup("author", author)
+
+    def by_publisher(self, publisher):
+        return self._lookup("publisher", publisher)
+
+    def authors(self):
+        return list(self._indexes["author"])
+
+    def publishers(self):
+        return list(self._indexes["publisher"])
+
+    def cheapest(self):
+        """All books at the lowest price"""
+        if self._cheapest is None:
+            self._cheapest = self.books.nsmallest(1, "price", keep="all")
+        return self._cheapest
+
+    def costliest(self):
+        """All books at the highest price"""
+        if self._costliest is None:
+            self._costliest = self.books.nlargest(1, "price", keep="all")
+        return self._costliest
+
+    def sorted_by_year(self):
+        if self._by_year is None:
+            order = np.argsort(self.books["year"].to_numpy(), kind="stable")
+            self._by_year = self._rows(order)
+        return self._by_year
+
+
+def benchmark(rows=5_000_000, queries=1000):
+    rng = np.random.default_rng(0)
+    authors = np.array(["Author %d" % i for i in range(20000)])
+    publishers = np.array(["Publisher %d" % i for i in range(500)])
+    books = pd.DataFrame({
+        "title": ["Book %d" % i for i in range(rows)],
+        "author": pd.Categorical(authors[rng.integers(0, len(authors), rows)]),
+        "edition": rng.integers(1, 10, rows),
+        "year": rng.integers(1900, 2025, rows),
+        "publisher": pd.Categorical(publishers[rng.integers(0, len(publishers), rows)]),
+        "price": rng.integers(100, 5000, rows),
+    })
+
+    start = time.perf_counter()
+    catalogue = BookCatalogue(books)
+    catalogue.cheapest()
+    catalogue.costliest()
+    catalogue.sorted_by_year()
+    print("Indexed %d books in %.2f s" % (rows, time.perf_counter() - start))
+
+    start = time.perf_counter()
+    for i in range(queries):
+        catalogue.by_author(authors[i])
+    print("by_author: %.3f ms/query" % ((time.perf_counter() - start) * 1000 / queries))
+
+    start = time.perf_counter()
+    for i in range(queries):
+        catalogue.by_publisher(publishers[i % len(publishers)])
+    print("by_publisher: %.3f ms/query" % ((time.perf_counter() - start) * 1000 / queries))
+
+    start = time.perf_counter()
+    for i in range(queries):
+        catalogue.by_publisher(publishers[i % 10])
+    print("repeated by_publisher: %.4f ms/query" % ((time.perf_counter() - start) * 1000 / queries))
+
+    start = time.perf_counter()
+    for _ in range(queries):
+        books[books["author"] == authors[0]]
+    print("boolean mask (old way): %.3f ms/query" % ((time.perf_counter() - start) * 1000 / queries))
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,152 @@
+"""Grouped statistics of the diamonds dataset in one pass (Pra 12 Assignment 1).
+
+The assignment asks for the mean price per cut, the count/min/max price per
+cut and the means of x, y and z. Instead of one groupby per question, every
+chunk of the data goes through a single combined aggregation producing
+partial sums, counts, minima and maxima per cut. The partials of all chunks
+are merged and turned into the three reports at the end, so a CSV far larger
+than memory is read once, chunk by chunk, with categorical cut/color/clarity
+columns.
+
+    python diamond_stats.py diamonds.csv
+    python diamond_stats.py --benchmark 50000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+
+CUTS = ["Fair", "Good", "Very Good", "Premium", "Ideal"]
+COLORS = ["D", "E", "F", "G", "H", "I", "J"]
+CLARITIES = ["I1", "SI2", "SI1", "VS2", "VS1", "VVS2", "VVS1", "IF"]
+DTYPES = {
+    "cut": pd.CategoricalDtype(CUTS, ordered=True),
+    "color": pd.CategoricalDtype(COLORS, ordered=True),
+    "clarity": pd.CategoricalDtype(CLARITIES, ordered=True),
+}
+COLUMNS = {"cut", "color", "clarity", "price", "x", "y", "z"}
+CHUNK_ROWS = 1_000_000
+
+# Partial aggregate column -> (source column, per-chunk function, merge function)
+PARTIALS = {
+    "count": ("price", "count", "sum"),
+    "price_sum": ("price", "sum", "sum"),
+    "price_min": ("price", "min", "min"),
+    "price_max": ("price", "max", "max"),
+    "x_sum": ("x", "sum", "sum"), "x_n": ("x", "count", "sum"),
+    "y_sum": ("y", "sum", "sum"), "y_n": ("y", "count", "sum"),
+    "z_sum": ("z", "sum", "sum"), "z_n": ("z", "count", "sum"),
+}
+
+
+def chunk_partials(chunk, by="cut"):
+    """All partial aggregates of one chunk, from a single groupby"""
+    return chunk.groupby(by, observed=True).agg(
+        **{name: (column, func) for name, (column, func, _) in PARTIALS.items()})
+
+
+def merge_partials(partials):
+    """Combine the partial aggregates of several chunks"""
+    combined = pd.concat(partials)
+    return combined.groupby(level=0, observed=True).agg(
+        {name: merge for name, (_, _, merge) in PARTIALS.items()})
+
+
+def reports(merged):
+    """The three reports of the assignment from merged partials"""
+    mean_price = (merged["price_sum"] / merged["count"]).rename("price")
+    price_stats = merged[["count", "price_min", "price_max"]].rename(
+        columns={"price_min": "min", "price_max": "max"})
+    xyz_means = pd.Series({c: merged[c + "_sum"].sum() / merged[c + "_n"].sum()
+                           for c in ("x", "y", "z")})
+    return mean_price, price_stats, xyz_means
+
+
+def read_chunks(path, chunk_rows=CHUNK_ROWS):
+    """Read the needed columns of a diamonds CSV in chunks"""
+    return pd.read_csv(path, usecols=lambda c: c in COLUMNS, dtype=DTYPES, chunksize=chunk_rows)
+
+
+def grouped_stats(chunks, by="cut"):
+    """Single-pass statistics of an iterable of DataFrame chunks"""
+    return reports(merge_partials([chunk_partials(chunk, by) for chunk in chunks]))
+
+
+def multi_pass(df):
+    """The original approach: a separate groupby for each question"""
+    mean_price = df.groupby("cut")["price"].mean()
+    price_stats = df.groupby("cut")["price"].agg(["count", "min", "max"])
+    xyz_means = df[["x", "y", "z"]].mean()
+    return mean_price, price_stats, xyz_means
+
+
+def synthetic_chunks(rows, chunk_rows=CHUNK_ROWS, seed=0):
+    """Random diamonds, generated chunk by chunk"""
+    rng = np.random.default_rng(seed)
+    for start in range(0, rows, chunk_rows):
+        n = min(chunk_rows, rows - start)
+        carat = rng.gamma(2.0, 0.4, n)
+        x = 4.0 + 2.5 * carat + rng.normal(0, 0.1, n)
+        yield pd.DataFrame({
+            "carat": carat,
+            "cut": pd.Categorical.from_codes(rng.integers(0, len(CUTS), n), dtype=DTYPES["cut"]),
+            "color": pd.Categorical.from_codes(rng.integers(0, len(COLORS), n), dtype=DTYPES["color"]),
+            "clarity": pd.Categorical.from_codes(rng.integers(0, len(CLARITIES), n),
+                                                 dtype=DTYPES["clarity"]),
+            "price": np.maximum(326, np.round(300 + 4000 * carat + rng.normal(0, 200, n))),
+            "x": x,
+            "y": x + rng.normal(0, 0.05, n),
+            "z": 0.62 * x + rng.normal(0, 0.05, n),
+        })
+
+
+def benchmark(rows=50_000_000, chunk_rows=CHUNK_ROWS):
+    """Time single-pass chunked statistics against the multi-pass version.
+
+    The multi-pass version runs on string (object) columns, as pd.read_csv
+    gives them by default. It needs the whole frame in memory, so it is
+    timed on each chunk and the times are added up.
+    """
+    single = multi = 0.0
+    partials = []
+    for chunk in synthetic_chunks(rows, chunk_rows):
+        start = time.perf_counter()
+        partials.append(chunk_partials(chunk))
+        single += time.perf_counter() - start
+
+        strings = chunk.astype({column: object for column in DTYPES})
+        start = time.perf_counter()
+        multi_pass(strings)
+        multi += time.perf_counter() - start
+
+    start = time.perf_counter()
+    mean_price, price_stats, xyz_means = reports(merge_partials(partials))
+    single += time.perf_counter() - start
+
+    print(price_stats.assign(mean=mean_price))
+    print("Single pass: %.2f s, multi-pass: %.2f s for %d rows (%.1fx)"
+          % (single, multi, rows, multi / single))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Price statistics per cut of a diamonds CSV")
+    parser.add_argument("path", nargs="?", help="diamonds CSV file")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--benchmark", type=int, metavar="ROWS",
+                        help="time against the multi-pass version on synthetic data")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark, args.chunk_rows)
+    elif args.path:
+        start = time.perf_counter()
+        mean_price, price_stats, xyz_means = grouped_stats(read_chunks(args.path, args.chunk_rows))
+        print("Mean price for each cut:\n", mean_price)
+        print("\nCount, Min, Max price for each cut:\n", price_stats)
+        print("\nAverage values of x, y, z:\n", xyz_means)
+        print("\n%.2f s" % (time.perf_counter() - start))
+    else:
+        parser.error("give a CSV path or --benchmark ROWS")
@@ -0,0 +1,112 @@
+"""Employee lookups over employee.xlsx for Pra 12 Assignment 2.
+
+Parsing a large workbook with openpyxl is slow, so the sheet is parsed only
+once and the DataFrame is pickled next to it. The pickle is reused while the
+workbook's mtime and size match; if they differ but the file's SHA-1 is the
+same (e.g. the workbook was copied or touched), the pickle is still used.
+
+EmployeeDirectory indexes the data once:
+
+    Employee ID  -> the DataFrame index (unique, hash lookups)
+    Department   -> row positions
+    Designation  -> row positions
+
+    directory = EmployeeDirectory(load_employees("employee.xlsx"))
+    print(directory.employee(1001))
+    print(directory.in_department("Automotive"))
+
+Run ``python employee_directory.py employee.xlsx`` to time cold and warm loads.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import time
+
+import pandas as pd
+
+
+ID_COLUMN = "Employee ID"
+GROUP_COLUMNS = ("Department", "Designation")
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _sha1(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _save_cache(cache, entry):
+    tmp = cache + ".tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, cache)
+
+
+def load_employees(path="employee.xlsx", cache=None):
+    """Read the workbook, parsing it only when its contents have changed"""
+    cache = cache or path + ".pkl"
+    stamp = _stamp(path)
+    try:
+        with open(cache, "rb") as f:
+            cached = pickle.load(f)
+        if cached["stamp"] == stamp:
+            return cached["employees"]
+        sha1 = _sha1(path)
+        if cached["sha1"] == sha1:
+            cached["stamp"] = stamp
+            _save_cache(cache, cached)
+            return cached["employees"]
+    except (OSError, EOFError, KeyError, pickle.UnpicklingError):
+        sha1 = _sha1(path)
+
+    employees = pd.read_excel(path)
+    employees.columns = employees.columns.str.strip()
+    for column in GROUP_COLUMNS:
+        if column in employees:
+            employees[column] = employees[column].astype("category")
+    _save_cache(cache, {"stamp": stamp, "sha1": sha1, "employees": employees})
+    return employees
+
+
+class EmployeeDirectory:
+    def __init__(self, employees):
+        if ID_COLUMN in employees:
+            employees = employees.set_index(ID_COLUMN, verify_integrity=True)
+        self.employees = employees
+        self._groups = {
+            column: employees.groupby(column, observed=True, sort=False).indices
+            for column in GROUP_COLUMNS if column in employees
+        }
+
+    def employee(self, emp_id):
+        """Details of one employee (an empty frame if the ID is unknown)"""
+        if emp_id not in self.employees.index:
+            return self.employees.iloc[:0]
+        return self.employees.loc[[emp_id]]
+
+    def _group(self, column, value):
+        return self.employees.iloc[self._groups.get(column, {}).get(value, [])]
+
+    def in_department(self, department):
+        return self._group("Department", department)
+
+    def with_designation(self, designation):
+        return self._group("Designation", designation)
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else "employee.xlsx"
+    for run in (1, 2):
+        start = time.perf_counter()
+        directory = EmployeeDirectory(load_employees(path))
+        print("Load %d: %.3f s (%d employees)"
+              % (run, time.perf_counter() - start, len(directory.employees)))
@@ -0,0 +1,175 @@
+"""Employee/Manager records for Pra 9 Assignment 1, sized for large rosters.
+
+Employee and Manager use __slots__, so an instance has no per-object
+__dict__. Managers can be bulk-loaded from CSV or JSON Lines files (fields
+name, age, salary, address) instead of being typed in field by field.
+
+For very large rosters ManagerTable keeps all records in one NumPy
+structured array (an array of structs): fixed-width UTF-8 name and address
+(32 and 64 bytes by default; longer values are rejected), uint8 age and
+float64 salary, about 105 bytes per record with no Python object per
+employee. Records come out as Manager objects when indexed; a slice is a
+ManagerTable sharing the same array.
+
+Run ``python employee_records.py`` for a bytes-per-employee comparison at
+1M records.
+"""
+
+import csv
+import json
+import numbers
+import sys
+import tracemalloc
+
+import numpy as np
+
+
+FIELDS = ("name", "age", "salary", "address")
+
+
+class Employee:
+    __slots__ = FIELDS
+
+    def __init__(self, name="", age=0, salary=0.0, address=""):
+        self.name = name
+        self.age = age
+        self.salary = salary
+        self.address = address
+
+    def getData(self):
+        self.name = input("Enter Name: ")
+        self.age = int(input("Enter Age: "))
+        self.salary = float(input("Enter Salary: "))
+        self.address = input("Enter Address: ")
+
+    def display(self):
+        print("Name:", self.name)
+        print("Age:", self.age)
+        print("Salary:", self.salary)
+        print("Address:", self.address)
+
+    def __repr__(self):
+        return "%s(%r, %d, %r, %r)" % (type(self).__name__, self.name, self.age,
+                                       self.salary, self.address)
+
+
+class Manager(Employee):
+    __slots__ = ()
+
+
+def _record(row):
+    return row["name"], int(row["age"]), float(row["salary"]), row["address"]
+
+
+def read_rows(path):
+    """Yield (name, age, salary, address) tuples from a CSV or .jsonl file"""
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith((".jsonl", ".json")):
+            for line in f:
+                if line.strip():
+                    yield _record(json.loads(line))
+        else:
+            for row in csv.DictReader(f):
+                yield _record(row)
+
+
+def load_managers(path, cls=Manager):
+    return [cls(*row) for row in read_rows(path)]
+
+
+class ManagerTable:
+    """Records stored in one structured array; indexing returns a Manager"""
+
+    def __init__(self, records=None, name_bytes=32, address_bytes=64):
+        self.dtype = np.dtype([("name", "S%d" % name_bytes), ("age", np.uint8),
+                               ("salary", np.float64), ("address", "S%d" % address_bytes)])
+        if records is not None:
+            self.dtype = records.dtype
+        self.records = np.empty(0, dtype=self.dtype) if records is None else records
+
+    @classmethod
+    def from_rows(cls, rows, chunk=100_000, **widths):
+        table = cls(**widths)
+        name_bytes = table.dtype["name"].itemsize
+        address_bytes = table.dtype["address"].itemsize
+        parts = []
+        batch = []
+        for n, (name, age, salary, address) in enumerate(rows, 1):
+            name, address = name.encode(), address.encode()
+            if len(name) > name_bytes:
+                raise ValueError("Row %d: name is %d bytes, the table holds %d"
+                                 % (n, len(name), name_bytes))
+            if len(address) > address_bytes:
+                raise ValueError("Row %d: address is %d bytes, the table holds %d"
+                                 % (n, len(address), address_bytes))
+            if not 0 <= age <= 255:
+                raise ValueError("Row %d: age %d is outside 0-255" % (n, age))
+            batch.append((name, age, salary, address))
+            if len(batch) == chunk:
+                parts.append(np.array(batch, dtype=table.dtype))
+                batch = []
+        if batch:
+            parts.append(np.array(batch, dtype=table.dtype))
+        if parts:
+            table.records = np.concatenate(parts)
+        return table
+
+    @classmethod
+    def load(cls, path, **widths):
+        return cls.from_rows(read_rows(path), **widths)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return type(self)(self.records[i])
+        if not isinstance(i, numbers.Integral):
+            raise TypeError("ManagerTable indices must be integers or slices, not %s"
+                            % type(i).__name__)
+        name, age, salary, address = self.records[i].tolist()
+        return Manager(name.decode(errors="ignore"), age, salary, address.decode(errors="ignore"))
+
+    def __iter__(self):
+        for i in range(len(self.records)):
+            yield self[i]
+
+    @property
+    def nbytes(self):
+        return self.records.nbytes
+
+
+class _PlainManager:
+    """The original record: attributes in a per-instance __dict__"""
+
+    def __init__(self, name, age, salary, address):
+        self.name = name
+        self.age = age
+        self.salary = salary
+        self.address = address
+
+
+def _measure(build):
+    """Bytes still allocated by build()'s result"""
+    tracemalloc.start()
+    result = build()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return used
+
+
+def benchmark(n=1_000_000):
+    def rows():
+        for i in range(n):
+            yield "Manager %d" % i, 20 + i % 45, 50000.0 + i, "%d MG Road, Pune" % i
+
+    for label, build in (("dict-based objects", lambda: [_PlainManager(*r) for r in rows()]),
+                         ("slotted Manager", lambda: [Manager(*r) for r in rows()]),
+                         ("ManagerTable", lambda: ManagerTable.from_rows(rows()))):
+        used = _measure(build)
+        print("%-20s %7.1f bytes/employee (%.0f MB)" % (label, used / n, used / 1e6))
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
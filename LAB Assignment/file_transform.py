@@ -0,0 +1,153 @@
+"""Streaming file transformations: uppercase copy (Pra 8 Assignment 1) and
+copying a Python script without its comments (Pra 8 Assignment 2).
+
+A transformation is a list of stages. Each stage takes an iterator of text
+pieces and yields text pieces, so files are processed in bounded-size
+buffers and memory stays flat however large the input is:
+
+    uppercase          - uppercases each piece
+    strip_comments     - removes Python comments found by the tokenize module,
+                         so '#' inside strings is kept and trailing comments
+                         are removed; comment-only lines are dropped
+
+    transform_file("input.txt", "output.txt", [uppercase])
+    transform_tree("src", "clean", [strip_comments], pattern="*.py", workers=8)
+"""
+
+import argparse
+import fnmatch
+import os
+import shutil
+import sys
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
+
+
+CHUNK_SIZE = 1 << 20
+
+
+def read_pieces(f, chunk_size=CHUNK_SIZE):
+    """Yield a text file in pieces of at most chunk_size characters"""
+    while True:
+        piece = f.read(chunk_size)
+        if not piece:
+            return
+        yield piece
+
+
+def iter_lines(pieces):
+    """Re-split text pieces into lines (line endings kept)"""
+    partial = ""
+    for piece in pieces:
+        text = partial + piece
+        end = text.rfind("\n")
+        if end == -1:
+            partial = text
+            continue
+        partial = text[end + 1:]
+        for line in text[:end].split("\n"):
+            yield line + "\n"
+    if partial:
+        yield partial
+
+
+def uppercase(pieces):
+    for piece in pieces:
+        yield piece.upper()
+
+
+def strip_comments(pieces):
+    """Remove Python comments; lines that held only a comment are dropped"""
+    lines = {}
+    line_iter = iter_lines(pieces)
+    row = 0
+
+    def readline():
+        nonlocal row
+        line = next(line_iter, "")
+        if line:
+            row += 1
+            lines[row] = line
+        return line
+
+    flushed = 0
+    for tok in tokenize.generate_tokens(readline):
+        start_row, col = tok.start
+        if tok.type == tokenize.COMMENT:
+            line = lines[start_row]
+            code = line[:col].rstrip()
+            if code:
+                lines[start_row] = code + line[len(line.rstrip("\r\n")):]
+            else:
+                lines[start_row] = None
+        # Rows before the current token can no longer change
+        while flushed + 1 < start_row:
+            flushed += 1
+            line = lines.pop(flushed, None)
+            if line is not None:
+                yield line
+    for r in sorted(lines):
+        if r > flushed and lines[r] is not None:
+            yield lines[r]
+
+
+def transform_file(src, dst, stages, chunk_size=CHUNK_SIZE):
+    """Stream src through the stages into dst; dst is untouched if a stage fails"""
+    tmp = dst + ".tmp"
+    try:
+        with open(src, "r", newline="") as fin, \
+                open(tmp, "w", newline="", buffering=chunk_size) as fout:
+            pieces = read_pieces(fin, chunk_size)
+            for stage in stages:
+                pieces = stage(pieces)
+            for piece in pieces:
+                fout.write(piece)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, dst)
+
+
+def transform_tree(src_dir, dst_dir, stages, pattern="*", workers=8):
+    """Transform every matching file under src_dir into the same path under dst_dir"""
+    jobs = []
+    for root, _, files in os.walk(src_dir):
+        for name in fnmatch.filter(files, pattern):
+            src = os.path.join(root, name)
+            dst = os.path.join(dst_dir, os.path.relpath(src, src_dir))
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            jobs.append((src, dst))
+
+    with ThreadPoolExecutor(workers) as pool:
+        futures = [pool.submit(transform_file, src, dst, stages) for src, dst in jobs]
+        for future in futures:
+            future.result()
+    return len(jobs)
+
+
+def print_file(path, out=None):
+    """Print a file without reading it into memory at once"""
+    with open(path, "r") as f:
+        shutil.copyfileobj(f, out or sys.stdout, CHUNK_SIZE)
+
+
+STAGES = {"upper": uppercase, "strip-comments": strip_comments}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream files through transformation stages")
+    parser.add_argument("src", help="source file or directory")
+    parser.add_argument("dst", help="destination file or directory")
+    parser.add_argument("--stage", action="append", choices=sorted(STAGES), required=True,
+                        help="stage to apply (repeat for several, applied in order)")
+    parser.add_argument("--pattern", default="*", help="file name pattern for directories")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    stages = [STAGES[name] for name in args.stage]
+    if os.path.isdir(args.src):
+        count = transform_tree(args.src, args.dst, stages, args.pattern, args.workers)
+        print("Transformed %d files" % count)
+    else:
+        transform_file(args.src, args.dst, stages)
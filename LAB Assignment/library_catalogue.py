@@ -0,0 +1,276 @@
+"""Library catalogue with O(1) lookups and SQLite persistence.
+
+Books are indexed by ISBN and by title, and the set of ISBNs with a copy on
+the shelf is kept up to date, so issuing and returning never scan the
+catalogue. A book can have several copies, and every Member keeps a record
+of the books they have on loan, so a book can only be returned by someone
+who borrowed it.
+
+With a database path every change is also written to SQLite; the whole
+catalogue is read back into the in-memory indexes when the Library is
+opened.
+
+    lib = Library("library.db")
+    lib.add_book("Wings of Fire", isbn="9788173711466", copies=3)
+    lib.add_member("Asha", member_id="M1")
+    lib.issue_book("Wings of Fire", "M1")
+    lib.return_book("9788173711466", "M1")
+
+Run ``python library_catalogue.py`` for an issue/return throughput benchmark.
+"""
+
+import itertools
+import sqlite3
+import time
+
+
+class LibraryError(Exception):
+    pass
+
+
+def _number(key, prefix):
+    """n for generated ids of the form prefix + n, otherwise 0"""
+    if key.startswith(prefix) and key[len(prefix):].isdigit():
+        return int(key[len(prefix):])
+    return 0
+
+
+class Book:
+    __slots__ = ("isbn", "title", "author", "copies", "available")
+
+    def __init__(self, isbn, title, author="", copies=1, available=None):
+        self.isbn = isbn
+        self.title = title
+        self.author = author
+        self.copies = copies
+        self.available = copies if available is None else available
+
+    def __repr__(self):
+        return "Book(%r, %r, %d/%d available)" % (self.isbn, self.title, self.available, self.copies)
+
+
+class Member:
+    __slots__ = ("member_id", "name", "loans")
+
+    def __init__(self, member_id, name):
+        self.member_id = member_id
+        self.name = name
+        self.loans = {}  # isbn -> number of copies borrowed
+
+    def __repr__(self):
+        return "Member(%r, %r, %d loans)" % (self.member_id, self.name, sum(self.loans.values()))
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS books (
+    isbn TEXT PRIMARY KEY, title TEXT NOT NULL, author TEXT,
+    copies INTEGER NOT NULL, available INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS members (member_id TEXT PRIMARY KEY, name TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS loans (
+    member_id TEXT NOT NULL, isbn TEXT NOT NULL, count INTEGER NOT NULL,
+    PRIMARY KEY (member_id, isbn));
+"""
+
+
+class Library:
+    def __init__(self, path=None, autocommit=True):
+        self.books = {}        # isbn -> Book
+        self.by_title = {}     # folded title -> {isbn, ...}
+        self.on_shelf = set()  # isbns with at least one available copy
+        self.members = {}      # member_id -> Member
+        self.autocommit = autocommit
+        # Next number for generated "LIB-<n>" ISBNs and "M<n>" member ids,
+        # always above every such id in the catalogue
+        self._next_book = 1
+        self._next_member = 1
+
+        self.db = None
+        if path is not None:
+            self.db = sqlite3.connect(path)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.executescript(SCHEMA)
+            self._load()
+
+    def _load(self):
+        books, by_title, on_shelf = self.books, self.by_title, self.on_shelf
+        for row in self.db.execute("SELECT * FROM books"):
+            book = Book(*row)
+            books[book.isbn] = book
+            titles = by_title.get(book.title.casefold())
+            if titles is None:
+                by_title[book.title.casefold()] = {book.isbn}
+            else:
+                titles.add(book.isbn)
+            if book.available > 0:
+                on_shelf.add(book.isbn)
+        for member_id, name in self.db.execute("SELECT * FROM members"):
+            self.members[member_id] = Member(member_id, name)
+        for member_id, isbn, count in self.db.execute("SELECT * FROM loans"):
+            self.members[member_id].loans[isbn] = count
+
+        (last_book,), = self.db.execute(
+            "SELECT MAX(CAST(SUBSTR(isbn, 5) AS INTEGER)) FROM books WHERE isbn GLOB 'LIB-[0-9]*'")
+        (last_member,), = self.db.execute(
+            "SELECT MAX(CAST(SUBSTR(member_id, 2) AS INTEGER)) FROM members WHERE member_id GLOB 'M[0-9]*'")
+        self._next_book = max(self._next_book, (last_book or 0) + 1)
+        self._next_member = max(self._next_member, (last_member or 0) + 1)
+
+    def _write(self, sql, params):
+        if self.db is not None:
+            self.db.execute(sql, params)
+            if self.autocommit:
+                self.db.commit()
+
+    def commit(self):
+        """Commit pending changes (when opened with autocommit=False)"""
+        if self.db is not None:
+            self.db.commit()
+
+    def close(self):
+        if self.db is not None:
+            self.db.commit()
+            self.db.close()
+            self.db = None
+
+    def _index(self, book):
+        self._next_book = max(self._next_book, _number(book.isbn, "LIB-") + 1)
+        self.books[book.isbn] = book
+        self.by_title.setdefault(book.title.casefold(), set()).add(book.isbn)
+        if book.available > 0:
+            self.on_shelf.add(book.isbn)
+
+    def _save_book(self, book):
+        self._write("INSERT OR REPLACE INTO books VALUES (?, ?, ?, ?, ?)",
+                    (book.isbn, book.title, book.author, book.copies, book.available))
+
+    def add_book(self, title, isbn=None, author="", copies=1):
+        """Add a book, or more copies of a book already in the catalogue"""
+        if isbn is None:
+            # Same title without an ISBN: treat as more copies of that book
+            existing = self.by_title.get(title.casefold())
+            if existing:
+                isbn = next(iter(existing))
+            else:
+                isbn = "LIB-%d" % self._next_book
+
+        book = self.books.get(isbn)
+        if book is None:
+            book = Book(isbn, title, author, copies)
+            self._index(book)
+        else:
+            book.copies += copies
+            book.available += copies
+            self.on_shelf.add(isbn)
+        self._save_book(book)
+        return book
+
+    def add_member(self, name, member_id=None):
+        if member_id is None:
+            member_id = "M%d" % self._next_member
+        if member_id in self.members:
+            raise LibraryError("Member %s already exists" % member_id)
+        self._next_member = max(self._next_member, _number(member_id, "M") + 1)
+        member = Member(member_id, name)
+        self.members[member_id] = member
+        self._write("INSERT INTO members VALUES (?, ?)", (member_id, name))
+        return member
+
+    def find(self, key):
+        """Books matching an ISBN or a title (case-insensitive)"""
+        if key in self.books:
+            return [self.books[key]]
+        return [self.books[isbn] for isbn in self.by_title.get(key.casefold(), ())]
+
+    def _member(self, member_id):
+        member = self.members.get(member_id)
+        if member is None:
+            raise LibraryError("No member with ID %s" % member_id)
+        return member
+
+    def issue_book(self, key, member_id):
+        """Lend one available copy of the book (ISBN or title) to a member"""
+        member = self._member(member_id)
+        books = self.find(key)
+        if not books:
+            raise LibraryError("Book not found")
+        book = next((b for b in books if b.isbn in self.on_shelf), None)
+        if book is None:
+            raise LibraryError("Book not available")
+
+        book.available -= 1
+        if book.available == 0:
+            self.on_shelf.discard(book.isbn)
+        member.loans[book.isbn] = member.loans.get(book.isbn, 0) + 1
+        self._save_loan(book, member)
+        return book
+
+    def return_book(self, key, member_id):
+        """Take back a copy that this member has borrowed"""
+        member = self._member(member_id)
+        book = next((b for b in self.find(key) if b.isbn in member.loans), None)
+        if book is None:
+            raise LibraryError("%s has not borrowed this book" % member.name)
+
+        book.available += 1
+        self.on_shelf.add(book.isbn)
+        member.loans[book.isbn] -= 1
+        if member.loans[book.isbn] == 0:
+            del member.loans[book.isbn]
+        self._save_loan(book, member)
+        return book
+
+    def _save_loan(self, book, member):
+        if self.db is None:
+            return
+        self.db.execute("UPDATE books SET available = ? WHERE isbn = ?", (book.available, book.isbn))
+        count = member.loans.get(book.isbn, 0)
+        if count:
+            self.db.execute("INSERT OR REPLACE INTO loans VALUES (?, ?, ?)",
+                            (member.member_id, book.isbn, count))
+        else:
+            self.db.execute("DELETE FROM loans WHERE member_id = ? AND isbn = ?",
+                            (member.member_id, book.isbn))
+        if self.autocommit:
+            self.db.commit()
+
+    def available_books(self):
+        return [self.books[isbn] for isbn in self.on_shelf]
+
+
+def benchmark(n_books=1_000_000, n_ops=200_000, path=":memory:"):
+    import random
+
+    lib = Library(path, autocommit=False)
+    lib.db.executemany("INSERT INTO books VALUES (?, ?, ?, ?, ?)",
+                       (("ISBN%07d" % i, "Title %d" % i, "", 2, 2) for i in range(n_books)))
+    lib.commit()
+
+    start = time.perf_counter()
+    lib.books.clear()
+    lib._load()
+    print("Loaded %d books in %.2f s" % (len(lib.books), time.perf_counter() - start))
+
+    members = [lib.add_member("Member %d" % i).member_id for i in range(1000)]
+    lib.commit()
+    rng = random.Random(0)
+    keys = ["ISBN%07d" % rng.randrange(n_books) for _ in range(n_ops)]
+
+    start = time.perf_counter()
+    issued = []
+    for key, member_id in zip(keys, itertools.cycle(members)):
+        try:
+            lib.issue_book(key, member_id)
+            issued.append((key, member_id))
+        except LibraryError:
+            pass
+    for key, member_id in issued:
+        lib.return_book(key, member_id)
+    lib.commit()
+    elapsed = time.perf_counter() - start
+    print("%d issues + %d returns in %.2f s (%.0f ops/s)"
+          % (len(issued), len(issued), elapsed, 2 * len(issued) / elapsed))
+
+
+if __name__ == "__main__":
+    benchmark()
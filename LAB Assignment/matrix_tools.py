@@ -0,0 +1,121 @@
+"""Matrix loading and (out-of-core) multiplication for the NumPy labs.
+
+Matrices are read from whole files instead of element-by-element input():
+text (.txt/.csv, one row per line) or .npy, optionally memory-mapped. When
+the operands and product do not fit in memory, blocked_matmul() multiplies
+tile by tile, reading only a few tiles at a time and writing the product
+straight into a memory-mapped .npy file (or an anonymous temporary file
+when no output path is given).
+
+    python matrix_tools.py A.npy B.npy -o C.npy --memory 2048
+
+prints the product's shape, the method used and the achieved GFLOP/s.
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+
+def load_matrix(path, mmap=False, dtype=None):
+    """Load a 2-D matrix from .npy (memory-mapped if ``mmap``) or a text file.
+
+    A memory-mapped matrix keeps its stored dtype, so asking for a different
+    ``dtype`` with ``mmap`` raises ValueError instead of copying it into memory.
+    """
+    if path.endswith(".npy"):
+        matrix = np.load(path, mmap_mode="r" if mmap else None)
+    else:
+        delimiter = "," if path.endswith(".csv") else None
+        matrix = np.loadtxt(path, delimiter=delimiter, dtype=dtype or float, ndmin=2)
+    if dtype is not None and matrix.dtype != dtype:
+        if isinstance(matrix, np.memmap):
+            raise ValueError("%s is stored as %s, cannot memory-map it as %s"
+                             % (path, matrix.dtype, np.dtype(dtype)))
+        matrix = matrix.astype(dtype)
+    return matrix
+
+
+def gflops(n, k, m, seconds):
+    """GFLOP/s of an (n x k) @ (k x m) product that took ``seconds``"""
+    return 2.0 * n * k * m / seconds / 1e9 if seconds > 0 else float("inf")
+
+
+def blocked_matmul(A, B, out=None, block=4096):
+    """Compute A @ B one (block x block) output tile at a time.
+
+    A, B and ``out`` may be memory-mapped, so only three tiles need to be in
+    memory at once: peak use is about 3 * block**2 elements.
+    """
+    n, k = A.shape
+    k2, m = B.shape
+    if k != k2:
+        raise ValueError("Cannot multiply %dx%d by %dx%d matrices" % (n, k, k2, m))
+    if out is None:
+        out = np.empty((n, m), dtype=np.result_type(A.dtype, B.dtype))
+
+    for i in range(0, n, block):
+        i_end = min(i + block, n)
+        for j in range(0, m, block):
+            j_end = min(j + block, m)
+            tile = np.zeros((i_end - i, j_end - j), dtype=out.dtype)
+            for p in range(0, k, block):
+                p_end = min(p + block, k)
+                tile += np.asarray(A[i:i_end, p:p_end]) @ np.asarray(B[p:p_end, j:j_end])
+            out[i:i_end, j:j_end] = tile
+    return out
+
+
+def multiply_files(path_a, path_b, out_path=None, memory_limit=2 * 2**30, block=None):
+    """Multiply two matrix files, going out-of-core when they do not fit.
+
+    Returns (product, method, seconds). With ``out_path`` the product is
+    written to that .npy file (memory-mapped when blocked); a blocked product
+    without ``out_path`` is memory-mapped onto a temporary file, deleted once
+    the returned array is released.
+    """
+    A = load_matrix(path_a, mmap=path_a.endswith(".npy"))
+    B = load_matrix(path_b, mmap=path_b.endswith(".npy"))
+    dtype = np.result_type(A.dtype, B.dtype)
+    needed = (A.size + B.size + A.shape[0] * B.shape[1]) * dtype.itemsize
+
+    start = time.perf_counter()
+    if needed <= memory_limit:
+        C = np.asarray(A) @ np.asarray(B)
+        method = "in-memory"
+        if out_path:
+            np.save(out_path, C)
+    else:
+        if block is None:
+            # Three tiles should use at most half of the memory budget
+            block = max(256, int((memory_limit / 2 / 3 / dtype.itemsize) ** 0.5))
+        shape = (A.shape[0], B.shape[1])
+        if out_path:
+            out = np.lib.format.open_memmap(out_path, mode="w+", dtype=dtype, shape=shape)
+        else:
+            with tempfile.TemporaryFile() as f:
+                out = np.memmap(f, dtype=dtype, mode="w+", shape=shape)
+        C = blocked_matmul(A, B, out=out, block=block)
+        C.flush()
+        method = "blocked (%d x %d tiles)" % (block, block)
+    return C, method, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Multiply two matrix files")
+    parser.add_argument("a", help="left matrix (.npy, .txt or .csv)")
+    parser.add_argument("b", help="right matrix (.npy, .txt or .csv)")
+    parser.add_argument("-o", "--output", help="save the product as .npy")
+    parser.add_argument("--memory", type=int, default=2048, help="memory budget in MiB")
+    parser.add_argument("--block", type=int, help="tile size for blocked multiplication")
+    args = parser.parse_args()
+
+    C, method, seconds = multiply_files(args.a, args.b, args.output,
+                                        args.memory * 2**20, args.block)
+    n, m = C.shape
+    k = load_matrix(args.a, mmap=args.a.endswith(".npy")).shape[1]
+    if C.size <= 100:
+        print(C)
+    print("Product: %dx%d, %s, %.3f s, %.1f GFLOP/s" % (n, m, method, seconds, gflops(n, k, m, seconds)))
@@ -0,0 +1,96 @@
+"""Pairs of elements with the minimum and maximum absolute difference.
+
+The maximum difference is always between the smallest and the largest
+element, so it needs one pass. The minimum difference is always between two
+neighbours once the values are sorted, so it needs one sort and one pass over
+adjacent differences: O(n log n) instead of comparing every pair.
+
+    from pair_difference import min_max_difference_pairs, read_numbers
+    (min_pair, min_diff), (max_pair, max_diff) = min_max_difference_pairs(read_numbers("numbers.txt"))
+
+Pairs are returned as (smaller, larger) and differences are exact Python
+numbers. Files are read whole: the minimum needs every value sorted.
+"""
+
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def min_max_difference_pairs(values):
+    """Return ((min_pair, min_diff), (max_pair, max_diff)) for two or more values"""
+    if np is not None:
+        arr = np.asarray(values)
+        if arr.size < 2:
+            raise ValueError("At least 2 elements are needed to form a pair")
+        arr = np.sort(arr, kind="stable")
+        if arr.dtype.kind == "i":
+            # Neighbours of sorted int64 values can be up to 2**64 - 1 apart:
+            # subtract as uint64, where the wrapped result is the exact gap
+            unsigned = arr.view(arr.dtype.str.replace("i", "u"))
+            diffs = unsigned[1:] - unsigned[:-1]
+        else:
+            diffs = np.diff(arr)
+        i = int(np.argmin(diffs))
+        min_pair = (arr[i].item(), arr[i + 1].item())
+        max_pair = (arr[0].item(), arr[-1].item())
+    else:
+        arr = sorted(values)
+        if len(arr) < 2:
+            raise ValueError("At least 2 elements are needed to form a pair")
+        i = min(range(len(arr) - 1), key=lambda k: arr[k + 1] - arr[k])
+        min_pair = (arr[i], arr[i + 1])
+        max_pair = (arr[0], arr[-1])
+
+    return (min_pair, min_pair[1] - min_pair[0]), (max_pair, max_pair[1] - max_pair[0])
+
+
+def read_numbers(path, dtype=int):
+    """Read whitespace/newline separated numbers from a text file"""
+    if np is not None:
+        return np.fromfile(path, dtype=np.int64 if dtype is int else np.float64, sep=" ")
+    with open(path) as f:
+        return [dtype(token) for line in f for token in line.split()]
+
+
+def brute_force_pairs(arr):
+    """The original Practice Q3b double loop, kept for benchmarking"""
+    min_diff = max_diff = abs(arr[0] - arr[1])
+    for i in range(len(arr)):
+        for j in range(i + 1, len(arr)):
+            diff = abs(arr[i] - arr[j])
+            min_diff = min(min_diff, diff)
+            max_diff = max(max_diff, diff)
+    return min_diff, max_diff
+
+
+def benchmark():
+    import random
+    data = [random.randint(-10**9, 10**9) for _ in range(3000)]
+    start = time.perf_counter()
+    expected = brute_force_pairs(data)
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    (_, min_diff), (_, max_diff) = min_max_difference_pairs(data)
+    fast_time = time.perf_counter() - start
+    assert (min_diff, max_diff) == expected
+    print("n = 3000: double loop %.2f s, sort + diff %.5f s" % (loop_time, fast_time))
+
+    if np is not None:
+        big = np.random.randint(-10**12, 10**12, size=10**7)
+        start = time.perf_counter()
+        min_max_difference_pairs(big)
+        print("n = 10^7: sort + diff %.2f s" % (time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] != "--benchmark":
+        (min_pair, min_diff), (max_pair, max_diff) = min_max_difference_pairs(read_numbers(sys.argv[1]))
+        print("Pair with minimum difference:", min_pair, "Difference =", min_diff)
+        print("Pair with maximum difference:", max_pair, "Difference =", max_diff)
+    else:
+        benchmark()
@@ -0,0 +1,151 @@
+"""Text patterns of Pra 3 Assignment 1, generated a whole row at a time.
+
+Every pattern is a generator of row strings (without the newline), built with
+string multiplication, slicing or by extending the previous row, never by
+printing one character at a time. write_rows() joins rows into large blocks
+before writing, so a 10,000-row pyramid costs a few hundred write() calls
+instead of ~10^8 print() calls. Rows are byte-for-byte what the original
+loops printed, trailing spaces included.
+
+    python patterns.py pyramid 10000 -o pyramid.txt
+    python patterns.py letter_rows --word PYTHON
+"""
+
+import argparse
+import sys
+
+
+BLOCK_SIZE = 1 << 20
+
+
+def write_rows(rows, out=None, block_size=BLOCK_SIZE):
+    """Write rows, each followed by a newline, in blocks of about block_size characters"""
+    out = out or sys.stdout
+    buffer = []
+    size = 0
+    for row in rows:
+        buffer.append(row)
+        size += len(row) + 1
+        if size >= block_size:
+            buffer.append("")
+            out.write("\n".join(buffer))
+            buffer = []
+            size = 0
+    if buffer:
+        buffer.append("")
+        out.write("\n".join(buffer))
+
+
+def count_up(n):
+    """1 / 12 / 123 / ..."""
+    row = ""
+    for i in range(1, n + 1):
+        row += str(i)
+        yield row
+
+
+def repeat_number(n):
+    """1 / 22 / 333 / ..."""
+    for i in range(1, n + 1):
+        yield str(i) * i
+
+
+def count_down(n):
+    """1 / 21 / 321 / ..."""
+    row = ""
+    for i in range(1, n + 1):
+        row = str(i) + row
+        yield row
+
+
+def alternating(n, first="1", second="0"):
+    """1 / 1 0 / 1 0 1 / ... (every symbol followed by a space)"""
+    unit = first + " " + second + " "
+    full = unit * (n // 2 + 1)
+    for i in range(1, n + 1):
+        yield full[:2 * i]
+
+
+def even_numbers(n, start=2):
+    """2 / 4 6 / 8 10 12 / ... (consecutive even numbers, each followed by a space)"""
+    num = start
+    for i in range(1, n + 1):
+        yield "".join("%d " % v for v in range(num, num + 2 * i, 2))
+        num += 2 * i
+
+
+def stars(n, symbol="*"):
+    """* / ** / *** / ..."""
+    for i in range(1, n + 1):
+        yield symbol * i
+
+
+def alphabet(n):
+    """A / AB / ABC / ..."""
+    row = ""
+    for i in range(n):
+        row += chr(65 + i)
+        yield row
+
+
+def letter_rows(word):
+    """P / YY / TTT / ... (row i repeats the i-th letter i times)"""
+    for i, ch in enumerate(word, 1):
+        yield ch * i
+
+
+def word_prefixes(word):
+    """P / PY / PYT / ..."""
+    for i in range(1, len(word) + 1):
+        yield word[:i]
+
+
+def number_line(n):
+    """1 2 3 ... n on one row (each number followed by a space)"""
+    yield "".join("%d " % i for i in range(1, n + 1))
+
+
+def inverted(n, symbol="*"):
+    """***** / **** / ... / *"""
+    for i in range(n, 0, -1):
+        yield symbol * i
+
+
+def pyramid(n):
+    """Centred pyramid of '* ', padded with two spaces per missing star"""
+    for i in range(1, n + 1):
+        yield "  " * (n - i) + "* " * (2 * i - 1)
+
+
+def diamond(n, symbol="*"):
+    """* / ** / ... / n stars / ... / *"""
+    yield from stars(n, symbol)
+    yield from inverted(n - 1, symbol)
+
+
+PATTERNS = {
+    "count_up": count_up, "repeat_number": repeat_number, "count_down": count_down,
+    "alternating": alternating, "even_numbers": even_numbers, "stars": stars,
+    "alphabet": alphabet, "number_line": number_line, "inverted": inverted,
+    "pyramid": pyramid, "diamond": diamond,
+}
+WORD_PATTERNS = {"letter_rows": letter_rows, "word_prefixes": word_prefixes}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print a text pattern")
+    parser.add_argument("pattern", choices=sorted(PATTERNS) + sorted(WORD_PATTERNS))
+    parser.add_argument("size", type=int, nargs="?", default=5, help="number of rows")
+    parser.add_argument("--word", default="PYTHON", help="word for letter_rows/word_prefixes")
+    parser.add_argument("-o", "--output", help="write to a file instead of the screen")
+    args = parser.parse_args()
+
+    if args.pattern in WORD_PATTERNS:
+        rows = WORD_PATTERNS[args.pattern](args.word)
+    else:
+        rows = PATTERNS[args.pattern](args.size)
+    if args.output:
+        with open(args.output, "w", buffering=BLOCK_SIZE) as out:
+            write_rows(rows, out)
+    else:
+        write_rows(rows)
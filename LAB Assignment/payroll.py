@@ -0,0 +1,196 @@
+"""Batch payroll for Pra 1 Assignment 1.
+
+Reads an employee roster (CSV or Parquet) with at least ``employee_id`` and
+``basic`` columns (``name``/``department`` and any others are passed through)
+and writes a payslip register: one row per employee with every allowance,
+deduction and the net salary.
+
+All money is integer paise (int64 columns), so no rounding error can build up.
+Allowances are percentages of the basic salary, rounded half-up to the paisa;
+deductions are fixed amounts per month. Every component is computed as one
+vectorised column operation per roster chunk, and each chunk's payslips are
+written before the next chunk is read.
+
+    python payroll.py roster.csv -o payslips.csv --rate DA=92 --deduction LIC=500
+    python payroll.py --benchmark 1000000
+"""
+
+import argparse
+import csv
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_RATES = {"DA": 92, "HRA": 58, "TA": 30}   # percent of basic salary
+DEFAULT_DEDUCTIONS = {"LIC": 500}                 # rupees per month
+CHUNK_ROWS = 250_000
+
+
+def to_paise(rupees, ids=None):
+    """Rupee amounts (numbers or numeric strings) as int64 paise.
+
+    Missing or infinite amounts raise ValueError naming the first one by its
+    entry in ``ids`` (e.g. the employee ids), or by position.
+    """
+    rupees = np.asarray(pd.to_numeric(rupees, errors="raise"), dtype=np.float64)
+    bad = ~np.isfinite(rupees)
+    if bad.any():
+        i = int(np.flatnonzero(bad)[0])
+        label = "employee_id %s" % np.asarray(ids)[i] if ids is not None else "row %d" % i
+        raise ValueError("%d missing or non-finite amount(s), first for %s"
+                         % (np.count_nonzero(bad), label))
+    return np.rint(rupees * 100).astype(np.int64)
+
+
+_PAISE_TEXT = np.array([".%02d" % i for i in range(100)], dtype=object)
+
+
+def format_rupees(paise):
+    """int64 paise as an object array of 'rupees.paise' strings"""
+    paise = np.asarray(paise, dtype=np.int64)
+    whole, frac = np.divmod(np.abs(paise), 100)
+    text = whole.astype(str).astype(object) + _PAISE_TEXT[frac]
+    negative = paise < 0
+    if negative.any():
+        text[negative] = "-" + text[negative]
+    return text
+
+
+def _normalise_columns(roster):
+    roster = roster.copy(deep=False)
+    roster.columns = [str(c).strip().lower().replace(" ", "_") for c in roster.columns]
+    missing = {"employee_id", "basic"} - set(roster.columns)
+    if missing:
+        raise ValueError("Roster is missing column(s): %s" % ", ".join(sorted(missing)))
+    return roster
+
+
+def compute_payroll(roster, rates=None, deductions=None):
+    """Payslip columns (all int64 paise) for a roster DataFrame"""
+    rates = DEFAULT_RATES if rates is None else rates
+    deductions = DEFAULT_DEDUCTIONS if deductions is None else deductions
+    roster = _normalise_columns(roster)
+
+    slips = roster.drop(columns="basic")
+    basic = to_paise(roster["basic"], roster["employee_id"])
+    slips["basic"] = basic
+    gross = basic.copy()
+    for component, percent in rates.items():
+        if not percent:
+            continue
+        # percent as basis points, so 92.5% works too; + 5000 rounds half-up
+        bp = int(round(percent * 100))
+        amount = (basic * bp + 5000) // 10000
+        slips[component] = amount
+        gross += amount
+    slips["gross"] = gross
+
+    net = gross.copy()
+    for component, rupees in deductions.items():
+        if not rupees:
+            continue
+        amount = int(round(rupees * 100))
+        slips[component] = np.full(len(slips), amount, dtype=np.int64)
+        net -= amount
+    slips["net"] = net
+    return slips
+
+
+def read_roster(path, chunk_rows=CHUNK_ROWS):
+    """Yield the roster in DataFrame chunks"""
+    if path.endswith(".parquet"):
+        # Parquet needs pyarrow (or fastparquet); it is read in one go
+        yield pd.read_parquet(path)
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_rows, dtype={"employee_id": str})
+
+
+def run_payroll(chunks, out_path, rates=None, deductions=None):
+    """Compute and write the payslips of every chunk; returns the employee count"""
+    count = 0
+    tmp = out_path + ".tmp"
+    try:
+        with open(tmp, "w", newline="", encoding="utf-8") as out:
+            writer = csv.writer(out)
+            for chunk in chunks:
+                slips = compute_payroll(chunk, rates, deductions)
+                first_money = slips.columns.get_loc("basic")
+                if count == 0:
+                    writer.writerow(slips.columns)
+                columns = [slips[c].to_numpy(dtype=object) for c in slips.columns[:first_money]]
+                columns += [format_rupees(slips[c]) for c in slips.columns[first_money:]]
+                writer.writerows(zip(*columns))
+                count += len(slips)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, out_path)
+    return count
+
+
+def synthetic_roster(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    departments = np.array(["Sales", "HR", "IT", "Finance", "Operations"])
+    return pd.DataFrame({
+        "employee_id": np.char.add("E", np.arange(rows).astype(str)),
+        "name": np.char.add("Employee ", np.arange(rows).astype(str)),
+        "department": departments[rng.integers(0, len(departments), rows)],
+        "basic": rng.integers(1_500_000, 15_000_000, rows) / 100,
+    })
+
+
+def benchmark(rows=1_000_000, out_path="payslips_benchmark.csv"):
+    roster = synthetic_roster(rows)
+    chunks = [roster.iloc[i:i + CHUNK_ROWS] for i in range(0, rows, CHUNK_ROWS)]
+
+    start = time.perf_counter()
+    compute_payroll(roster)
+    computed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    run_payroll(chunks, out_path)
+    written = time.perf_counter() - start
+    print("%d employees: computed in %.2f s, payslips written in %.2f s (%.1f MB)"
+          % (rows, computed, written, os.path.getsize(out_path) / 1e6))
+    os.remove(out_path)
+
+
+def _amounts(pairs):
+    amounts = {}
+    for pair in pairs:
+        name, _, value = pair.partition("=")
+        amounts[name.strip()] = float(value)
+    return amounts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compute payslips for an employee roster")
+    parser.add_argument("roster", nargs="?", help="roster CSV or Parquet file")
+    parser.add_argument("-o", "--output", default="payslips.csv")
+    parser.add_argument("--rate", action="append", metavar="NAME=PERCENT",
+                        help="set an allowance as a percent of basic (defaults DA=92 HRA=58 TA=30)")
+    parser.add_argument("--deduction", action="append", metavar="NAME=RUPEES",
+                        help="set a fixed monthly deduction (default LIC=500)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--benchmark", type=int, metavar="ROWS")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+    elif args.roster:
+        # Overrides are merged into the defaults; NAME=0 removes a component
+        rates = {**DEFAULT_RATES, **_amounts(args.rate or [])}
+        deductions = {**DEFAULT_DEDUCTIONS, **_amounts(args.deduction or [])}
+        start = time.perf_counter()
+        try:
+            count = run_payroll(read_roster(args.roster, args.chunk_rows), args.output,
+                                rates, deductions)
+        except ValueError as e:
+            parser.exit(1, "%s: error: %s\n" % (parser.prog, e))
+        print("Wrote %d payslips to %s in %.2f s" % (count, args.output, time.perf_counter() - start))
+    else:
+        parser.error("give a roster file or --benchmark ROWS")
@@ -0,0 +1,191 @@
+"""One-pass price statistics for Pra 5 (sold-item prices of a day).
+
+PriceStats is updated with blocks of prices and keeps only:
+
+    count, total, min, max, how many times the max occurred
+    the k cheapest and k costliest prices (two heaps of size k)
+    optionally a histogram of integer prices (a counting sort)
+
+so a sales file of any size is summarised in a single read with O(k) memory
+(plus the histogram, whose size depends on the price range, not on the
+number of sales). Each block is reduced with NumPy first and only its own k
+best candidates go through the heaps.
+
+    python price_stats.py sales_day.txt -k 10 --sorted
+"""
+
+import argparse
+import heapq
+import time
+
+import numpy as np
+
+
+TEXT_CHUNK_BYTES = 8 * 2**20
+
+
+class PriceStats:
+    def __init__(self, k=0, histogram=False):
+        self.k = k
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.max_count = 0
+        self._top = []     # min-heap of the k largest prices
+        self._bottom = []  # min-heap of the negated k smallest prices
+        self._histogram = np.zeros(0, dtype=np.int64) if histogram else None
+        self._offset = 0   # price of histogram bin 0
+
+    def update(self, prices):
+        """Add a block of prices"""
+        prices = np.asarray(prices)
+        if prices.size == 0:
+            return self
+        prices = prices.ravel()
+        self.count += prices.size
+        self.total += prices.sum().item()
+
+        lo, hi = prices.min().item(), prices.max().item()
+        if self.min is None or lo < self.min:
+            self.min = lo
+        if self.max is None or hi > self.max:
+            self.max, self.max_count = hi, 0
+        if hi == self.max:
+            self.max_count += int(np.count_nonzero(prices == hi))
+
+        if self.k:
+            self._update_heaps(prices)
+        if self._histogram is not None:
+            self._update_histogram(prices, lo, hi)
+        return self
+
+    def add(self, price):
+        return self.update([price])
+
+    def _update_heaps(self, prices):
+        k = self.k
+        if prices.size > k:
+            largest = np.partition(prices, prices.size - k)[prices.size - k:]
+            smallest = np.partition(prices, k - 1)[:k]
+        else:
+            largest = smallest = prices
+        for p in largest.tolist():
+            if len(self._top) < k:
+                heapq.heappush(self._top, p)
+            elif p > self._top[0]:
+                heapq.heapreplace(self._top, p)
+        for p in smallest.tolist():
+            if len(self._bottom) < k:
+                heapq.heappush(self._bottom, -p)
+            elif -p > self._bottom[0]:
+                heapq.heapreplace(self._bottom, -p)
+
+    def _update_histogram(self, prices, lo, hi):
+        if not np.issubdtype(prices.dtype, np.integer):
+            raise TypeError("Counting sort needs integer prices")
+        hist = self._histogram
+        if hist.size == 0:
+            self._offset = lo
+        elif lo < self._offset:
+            hist = np.concatenate([np.zeros(self._offset - lo, dtype=np.int64), hist])
+            self._offset = lo
+        needed = hi - self._offset + 1
+        if needed > hist.size:
+            hist = np.concatenate([hist, np.zeros(needed - hist.size, dtype=np.int64)])
+        start = lo - self._offset
+        hist[start:needed] += np.bincount(prices - lo, minlength=hi - lo + 1)
+        self._histogram = hist
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def top(self):
+        """The k highest prices, highest first"""
+        return sorted(self._top, reverse=True)
+
+    def bottom(self):
+        """The k lowest prices, lowest first"""
+        return sorted(-p for p in self._bottom)
+
+    def sorted_prices(self):
+        """All prices in ascending order, from the histogram"""
+        if self._histogram is None:
+            raise ValueError("PriceStats was created without histogram=True")
+        values = np.arange(self._offset, self._offset + self._histogram.size)
+        return np.repeat(values, self._histogram)
+
+
+def counting_sort(values):
+    """Sort integers with a histogram when their range is not much larger than
+    their number, otherwise with sorted()"""
+    values = tuple(values)
+    if not values:
+        return values
+    lo, hi = min(values), max(values)
+    if hi - lo > 4 * len(values) + 1024:
+        return tuple(sorted(values))
+    return tuple(PriceStats(histogram=True).update(np.array(values, dtype=np.int64))
+                 .sorted_prices().tolist())
+
+
+def _parse(data, dtype):
+    """Numbers from a block of whitespace separated text"""
+    try:
+        return np.fromstring(data, dtype=dtype, sep=" ")
+    except ValueError:
+        # Let the slower path report which token is not a number
+        return np.array(data.split()).astype(dtype)
+
+
+def read_prices(path, dtype=np.int64, chunk_bytes=TEXT_CHUNK_BYTES):
+    """Yield arrays of whitespace separated prices from a text file"""
+    with open(path, "rb") as f:
+        tail = b""
+        while True:
+            data = f.read(chunk_bytes)
+            if not data:
+                break
+            data = tail + data
+            # Keep a number cut by the chunk boundary for the next block
+            cut = max(data.rfind(b" "), data.rfind(b"\n"), data.rfind(b"\t"))
+            if cut == -1:
+                tail = data
+                continue
+            tail = data[cut + 1:]
+            yield _parse(data[:cut], dtype)
+        if tail.strip():
+            yield _parse(tail, dtype)
+
+
+def file_stats(path, k=0, histogram=False, dtype=np.int64):
+    stats = PriceStats(k, histogram)
+    for block in read_prices(path, dtype):
+        stats.update(block)
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="One-pass statistics of a day's sale prices")
+    parser.add_argument("path", help="text file of prices separated by spaces/newlines")
+    parser.add_argument("-k", type=int, default=5, help="how many cheapest/costliest prices to keep")
+    parser.add_argument("--float", action="store_true", help="prices have decimals")
+    parser.add_argument("--sorted", action="store_true",
+                        help="also print the sorted prices (counting sort, integers only)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = file_stats(args.path, args.k, args.sorted, np.float64 if args.float else np.int64)
+    elapsed = time.perf_counter() - start
+
+    print("Total items sold:", stats.count)
+    print("Cheapest item price:", stats.min)
+    print("Costliest item price:", stats.max)
+    print("Number of costliest items sold:", stats.max_count)
+    print("Total sales:", stats.total)
+    print("%d cheapest:" % args.k, stats.bottom())
+    print("%d costliest:" % args.k, stats.top())
+    if args.sorted:
+        print("Prices in ascending order:", stats.sorted_prices())
+    print("%.2f s" % elapsed)
@@ -0,0 +1,164 @@
+"""Prime numbers in a range [N1, N2] using a segmented Sieve of Eratosthenes.
+
+Only odd numbers are stored, one byte each, and the range is processed in
+windows of ``segment_size`` numbers, so memory stays bounded however large
+N2 is. Segments can be sieved in parallel by a process pool.
+
+    from primes import primes_between, count_primes
+    print(list(primes_between(10, 50)))
+    print(count_primes(10**10, 10**10 + 10**8, workers=4))
+
+Run ``python primes.py --benchmark`` to compare with the trial-division loop
+of Pra 3 Task 7.
+"""
+
+import argparse
+import math
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@lru_cache(maxsize=8)
+def base_primes(limit):
+    """All primes <= limit with a plain sieve (limit is at most sqrt(N2))"""
+    if limit < 2:
+        return ()
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, math.isqrt(limit) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return tuple(i for i in range(limit + 1) if sieve[i])
+
+
+def _sieve_odd_segment(lo, hi):
+    """Sieve the odd numbers in [lo, hi); lo must be odd. Byte i is lo + 2*i."""
+    size = (hi - lo + 1) // 2
+    segment = bytearray([1]) * size
+    for p in base_primes(math.isqrt(hi - 1))[1:]:
+        start = max(p * p, -(-lo // p) * p)
+        if start % 2 == 0:
+            start += p
+        index = (start - lo) // 2
+        if index < size:
+            segment[index::p] = bytes((size - 1 - index) // p + 1)
+    if lo == 1:
+        segment[0] = 0
+    return segment
+
+
+def _segment_primes(lo, hi):
+    """Primes among the odd numbers of [lo, hi) as a list"""
+    segment = _sieve_odd_segment(lo, hi)
+    if np is not None:
+        return (np.flatnonzero(np.frombuffer(segment, dtype=np.uint8)) * 2 + lo).tolist()
+    primes = []
+    i = segment.find(1)
+    while i != -1:
+        primes.append(lo + 2 * i)
+        i = segment.find(1, i + 1)
+    return primes
+
+
+def _segment_count(lo, hi):
+    return _sieve_odd_segment(lo, hi).count(1)
+
+
+def _segments(n1, n2, segment_size):
+    """Odd-aligned [lo, hi) windows covering the odd numbers of [n1, n2]"""
+    lo = max(n1, 1) | 1
+    segment_size += segment_size % 2
+    while lo <= n2:
+        hi = min(lo + segment_size, n2 + 1)
+        yield lo, hi
+        lo = hi | 1
+
+
+def _run(func, n1, n2, segment_size, workers):
+    """Yield func(lo, hi) for every segment, in order"""
+    if workers <= 1:
+        for lo, hi in _segments(n1, n2, segment_size):
+            yield func(lo, hi)
+        return
+
+    # Keep only a few segments in flight so memory stays bounded
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for lo, hi in _segments(n1, n2, segment_size):
+            pending.append(pool.submit(func, lo, hi))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def primes_between(n1, n2, segment_size=10**7, workers=1):
+    """Generate the primes p with n1 <= p <= n2 in increasing order"""
+    if n1 <= 2 <= n2:
+        yield 2
+    for primes in _run(_segment_primes, n1, n2, segment_size, workers):
+        yield from primes
+
+
+def count_primes(n1, n2, segment_size=10**7, workers=1):
+    """Number of primes p with n1 <= p <= n2"""
+    count = 1 if n1 <= 2 <= n2 else 0
+    return count + sum(_run(_segment_count, n1, n2, segment_size, workers))
+
+
+def trial_division_primes(n1, n2):
+    """The original Pra 3 Task 7 loop, kept for benchmarking"""
+    primes = []
+    for num in range(n1, n2 + 1):
+        if num > 1:
+            for i in range(2, num):
+                if (num % i) == 0:
+                    break
+            else:
+                primes.append(num)
+    return primes
+
+
+def benchmark(workers=4):
+    print("Range [1, 20000]:")
+    start = time.perf_counter()
+    slow = trial_division_primes(1, 20000)
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    fast = list(primes_between(1, 20000))
+    sieve_time = time.perf_counter() - start
+    assert slow == fast
+    print("  trial division: %.3f s, sieve: %.5f s (%d primes)" % (loop_time, sieve_time, len(fast)))
+
+    n1, n2 = 10**10, 10**10 + 10**8
+    for w in (1, workers):
+        start = time.perf_counter()
+        count = count_primes(n1, n2, workers=w)
+        print("Count in [10^10, 10^10 + 10^8] with %d worker(s): %d primes in %.2f s"
+              % (w, count, time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prime numbers between N1 and N2")
+    parser.add_argument("n1", type=int, nargs="?")
+    parser.add_argument("n2", type=int, nargs="?")
+    parser.add_argument("--count", action="store_true", help="only print how many primes")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--benchmark", action="store_true")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+    elif args.n1 is None or args.n2 is None:
+        parser.error("N1 and N2 are required")
+    elif args.count:
+        print(count_primes(args.n1, args.n2, workers=args.workers))
+    else:
+        print(*primes_between(args.n1, args.n2, workers=args.workers))
@@ -0,0 +1,191 @@
+"""Sales analytics for Pra 11 Assignment 1.
+
+Sales come from daily per-product CSV files with columns ``date``, ``sales``
+and optionally ``profit`` (and ``product``; if it is missing the file name is
+used, e.g. ``face_cream.csv`` -> "face cream"). They are combined into one
+DataFrame and aggregated by day/month and product with pandas.
+
+render() draws the four views of the assignment into one 2x2 figure and saves
+it with the headless Agg backend:
+
+    a) total profit over time (line)
+    b) sales of every product over time (multi-line)
+    c) monthly sales per product over the last 12 months (grouped bars)
+    d) the last year's sales share of each product (pie)
+
+Long daily series are reduced with min/max downsampling before plotting:
+each of ``max_points / 2`` buckets keeps its lowest and highest point, so
+peaks and dips survive while millions of points become a few thousand.
+
+    python sales_analytics.py sales/*.csv -o sales_report.png
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+
+MAX_POINTS = 2000
+MAX_PRODUCTS = 8
+BAR_MONTHS = 12
+
+
+def read_sales_file(path):
+    """One daily sales file as (date, product, sales, profit) rows"""
+    df = pd.read_csv(path, parse_dates=["date"])
+    if "product" not in df:
+        name = os.path.splitext(os.path.basename(path))[0]
+        df["product"] = name.replace("_", " ")
+    if "profit" not in df:
+        df["profit"] = np.nan
+    return df[["date", "product", "sales", "profit"]]
+
+
+def load_sales(paths):
+    sales = pd.concat([read_sales_file(p) for p in paths], ignore_index=True)
+    sales["product"] = sales["product"].astype("category")
+    return sales
+
+
+def by_period(sales, column="sales", freq="D"):
+    """Table of period x product totals of a column"""
+    periods = sales["date"].dt.to_period(freq)
+    return sales.pivot_table(index=periods, columns="product", values=column,
+                             aggfunc="sum", observed=True).fillna(0)
+
+
+def minmax_downsample(x, y, max_points=MAX_POINTS):
+    """Keep the minimum and maximum of each bucket, in their original order"""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+    if n <= max_points:
+        return x, y
+    size = -(-n // (max_points // 2))  # points per bucket, rounded up
+    buckets = -(-n // size)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    blocks = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    lo = offsets + np.nanargmin(blocks, axis=1)
+    hi = offsets + np.nanargmax(blocks, axis=1)
+    keep = np.unique(np.concatenate([lo, hi]))
+    return x[keep], y[keep]
+
+
+def _top_products(totals, max_products):
+    """The best selling products, the rest summed up as "Other" """
+    totals = totals.sort_values(ascending=False)
+    if len(totals) <= max_products:
+        return totals
+    top = totals.iloc[:max_products - 1]
+    return pd.concat([top, pd.Series({"Other": totals.iloc[max_products - 1:].sum()})])
+
+
+def _with_other(table, products):
+    """The columns of table for products, the remaining ones summed as "Other" """
+    named = [p for p in products if p in table.columns and p != "Other"]
+    result = table[named]
+    result.columns = result.columns.astype(object)
+    if "Other" in products:
+        result = result.assign(Other=table.drop(columns=named).sum(axis=1))
+    return result
+
+
+def render(sales, output="sales_report.png", profit=None, max_points=MAX_POINTS,
+           max_products=MAX_PRODUCTS, freq="D"):
+    """Save the four sales views as one figure; returns the output path.
+
+    ``profit`` is a Series of total profit by date; by default it is the sum
+    of the ``profit`` column over all products.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    daily = by_period(sales, "sales", freq)
+    if profit is None:
+        profit = sales.groupby("date")["profit"].sum(min_count=1).dropna()
+    products = _top_products(daily.sum(), max_products).index
+    monthly = _with_other(by_period(sales, "sales", "M"), products).iloc[-BAR_MONTHS:]
+    daily = _with_other(daily, products)
+    shown = list(daily.columns)
+    last_year = sales["date"].dt.year.max()
+    year_totals = _top_products(
+        sales[sales["date"].dt.year == last_year].groupby("product", observed=True)["sales"].sum(),
+        max_products)
+
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    (ax_profit, ax_lines), (ax_bar, ax_pie) = axes
+
+    x, y = minmax_downsample(profit.index.to_numpy(), profit.to_numpy(), max_points)
+    ax_profit.plot(x, y)
+    ax_profit.set_title("Total Profit")
+    ax_profit.set_xlabel("Date")
+    ax_profit.set_ylabel("Profit")
+
+    dates = daily.index.to_timestamp().to_numpy()
+    for product in shown:
+        x, y = minmax_downsample(dates, daily[product].to_numpy(), max_points)
+        ax_lines.plot(x, y, label=str(product))
+    ax_lines.set_title("Product Sales")
+    ax_lines.set_xlabel("Date")
+    ax_lines.legend(loc="upper left")
+
+    months = np.arange(len(monthly))
+    width = 0.8 / max(1, len(shown))
+    for i, product in enumerate(shown):
+        ax_bar.bar(months + i * width, monthly[product].to_numpy(), width, label=str(product))
+    ax_bar.set_xticks(months + 0.4 - width / 2)
+    ax_bar.set_xticklabels([str(m) for m in monthly.index], rotation=45)
+    ax_bar.set_title("Monthly Sales")
+    ax_bar.legend(loc="upper left")
+
+    ax_pie.pie(year_totals.to_numpy(), labels=[str(p) for p in year_totals.index],
+               autopct="%1.1f%%")
+    ax_pie.set_title("Sales in %d" % last_year)
+
+    fig.tight_layout()
+    fig.savefig(output, dpi=150)
+    plt.close(fig)
+    return output
+
+
+def synthetic_sales(products=10, days=365 * 5, start="2020-01-01", seed=0):
+    """Random daily sales of several products"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start, periods=days, freq="D")
+    frames = []
+    for p in range(products):
+        base = rng.uniform(50, 500)
+        season = 1 + 0.3 * np.sin(np.arange(days) * 2 * np.pi / 365 + rng.uniform(0, 6))
+        sales = rng.poisson(base * season)
+        frames.append(pd.DataFrame({"date": dates, "product": "Product %d" % p,
+                                    "sales": sales, "profit": sales * rng.uniform(5, 20)}))
+    sales = pd.concat(frames, ignore_index=True)
+    sales["product"] = sales["product"].astype("category")
+    return sales
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sales report figure from daily per-product files")
+    parser.add_argument("paths", nargs="*", help="daily sales CSV files")
+    parser.add_argument("-o", "--output", default="sales_report.png")
+    parser.add_argument("--max-points", type=int, default=MAX_POINTS)
+    parser.add_argument("--products", type=int, default=MAX_PRODUCTS,
+                        help="products shown separately (the rest are summed as Other)")
+    parser.add_argument("--demo", type=int, metavar="DAYS", help="use synthetic sales of DAYS days")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.demo:
+        sales = synthetic_sales(days=args.demo)
+    elif args.paths:
+        sales = load_sales(args.paths)
+    else:
+        parser.error("give sales files or --demo DAYS")
+    render(sales, args.output, max_points=args.max_points, max_products=args.products)
+    print("Saved %s (%d sales rows) in %.2f s" % (args.output, len(sales), time.perf_counter() - start))
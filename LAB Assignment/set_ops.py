@@ -0,0 +1,249 @@
+"""Set operations on NumPy arrays: difference, intersection, union and
+symmetric difference, each returning sorted distinct values like np.setdiff1d.
+
+Integer arrays whose values fall in a compact range are handled with a
+lookup table indexed by value (direct hashing, O(n)); everything else uses
+NumPy's sort-based routines. For .npy files larger than memory,
+chunked_set_operation() memory-maps the inputs, splits both into value-range
+buckets on disk (edges taken from quantiles of a random sample, so skewed
+data still gives evenly sized buckets) and combines them one bucket at a time.
+
+    from set_ops import difference, chunked_set_operation
+    print(difference(np.array([0, 10, 20, 40]), np.array([10, 40])))
+    chunked_set_operation("difference", "a.npy", "b.npy", "out.npy")
+
+Run ``python set_ops.py`` for a benchmark against the element-by-element loop.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+
+OPERATIONS = ("difference", "intersection", "union", "symmetric_difference")
+
+# Use the lookup table when the value range is at most this many times the input size
+TABLE_RANGE_FACTOR = 4
+
+# Bucket edges come from SAMPLE_RUNS random runs of SAMPLE_RUN contiguous
+# values (cheap to read from a memory map); at most MAX_OPEN_BUCKETS bucket
+# files are open at once
+SAMPLE_RUNS = 1000
+SAMPLE_RUN = 1000
+MAX_OPEN_BUCKETS = 64
+
+
+def _table_path(a, b):
+    """(low, high) if both arrays are integers in a compact range, else None"""
+    if a.dtype.kind not in "iu" or b.dtype.kind not in "iu" or (a.size + b.size) == 0:
+        return None
+    if np.uint64 in (a.dtype, b.dtype):
+        return None
+    low = min(a.min() if a.size else b.min(), b.min() if b.size else a.min())
+    high = max(a.max() if a.size else b.max(), b.max() if b.size else a.max())
+    if int(high) - int(low) + 1 > TABLE_RANGE_FACTOR * (a.size + b.size) + 1024:
+        return None
+    return int(low), int(high)
+
+
+def _membership(values, low, size):
+    table = np.zeros(size, dtype=bool)
+    table[values - low] = True
+    return table
+
+
+def set_operation(op, a, b):
+    """Apply one of OPERATIONS to two arrays"""
+    a = np.asarray(a).ravel()
+    b = np.asarray(b).ravel()
+
+    bounds = _table_path(a, b)
+    if bounds is not None:
+        low, high = bounds
+        in_a = _membership(a.astype(np.int64), low, high - low + 1)
+        in_b = _membership(b.astype(np.int64), low, high - low + 1)
+        if op == "difference":
+            keep = in_a & ~in_b
+        elif op == "intersection":
+            keep = in_a & in_b
+        elif op == "union":
+            keep = in_a | in_b
+        elif op == "symmetric_difference":
+            keep = in_a ^ in_b
+        else:
+            raise ValueError("Unknown set operation: %s" % op)
+        return (np.flatnonzero(keep) + low).astype(np.result_type(a, b))
+
+    if op == "difference":
+        return np.setdiff1d(a, b)
+    elif op == "intersection":
+        return np.intersect1d(a, b)
+    elif op == "union":
+        return np.union1d(a, b)
+    elif op == "symmetric_difference":
+        return np.setxor1d(a, b)
+    raise ValueError("Unknown set operation: %s" % op)
+
+
+def difference(a, b):
+    """Sorted distinct values in a that are not in b"""
+    return set_operation("difference", a, b)
+
+
+def intersection(a, b):
+    return set_operation("intersection", a, b)
+
+
+def union(a, b):
+    return set_operation("union", a, b)
+
+
+def symmetric_difference(a, b):
+    return set_operation("symmetric_difference", a, b)
+
+
+def _chunks(arr, chunk_size):
+    for start in range(0, arr.shape[0], chunk_size):
+        yield np.asarray(arr[start:start + chunk_size])
+
+
+def _bucket_edges(arrays, n_buckets, dtype):
+    """Distinct values splitting a random sample of the arrays into n_buckets equal parts"""
+    if n_buckets <= 1:
+        return np.empty(0, dtype=dtype)
+    rng = np.random.default_rng(0)
+    total = sum(arr.shape[0] for arr in arrays)
+    sample = []
+    for arr in arrays:
+        n = arr.shape[0]
+        if n <= SAMPLE_RUNS * SAMPLE_RUN:
+            sample.append(np.asarray(arr))
+            continue
+        # Each input contributes runs in proportion to its length
+        runs = -(-SAMPLE_RUNS * n // total)
+        for start in np.sort(rng.integers(0, n - SAMPLE_RUN, size=runs)):
+            sample.append(np.asarray(arr[start:start + SAMPLE_RUN]))
+    sample = np.sort(np.concatenate(sample).astype(dtype, copy=False))
+    positions = np.arange(1, n_buckets) * sample.size // n_buckets
+    return np.unique(sample[positions])
+
+
+def chunked_set_operation(op, path_a, path_b, out_path,
+                          memory_limit=256 * 2**20, tmp_dir=None):
+    """Apply a set operation to two 1-D .npy files and save the result as .npy.
+
+    Values are range-partitioned into buckets so that one bucket of each
+    input fits in about ``memory_limit`` bytes. Buckets are processed in
+    value order, so concatenating the per-bucket results is already sorted.
+    Returns the number of values written.
+    """
+    if op not in OPERATIONS:
+        raise ValueError("Unknown set operation: %s" % op)
+    a = np.load(path_a, mmap_mode="r")
+    b = np.load(path_b, mmap_mode="r")
+    dtype = np.result_type(a.dtype, b.dtype)
+    chunk_size = max(1, memory_limit // (4 * dtype.itemsize))
+
+    if a.shape[0] + b.shape[0] == 0:
+        np.save(out_path, np.empty(0, dtype=dtype))
+        return 0
+
+    # Pass 1: bucket edges at evenly spaced quantiles of a sample of both inputs
+    total_bytes = (a.shape[0] + b.shape[0]) * dtype.itemsize
+    n_buckets = max(1, -(-total_bytes // (memory_limit // 4)))
+    edges = _bucket_edges((a, b), n_buckets, dtype)
+    n_buckets = len(edges) + 1
+
+    work_dir = tempfile.mkdtemp(dir=tmp_dir)
+    try:
+        # Pass 2: spill each input into per-bucket raw files, with at most
+        # MAX_OPEN_BUCKETS files open (one read of the input per group)
+        for name, arr in (("a", a), ("b", b)):
+            for first in range(0, n_buckets, MAX_OPEN_BUCKETS):
+                last = min(first + MAX_OPEN_BUCKETS, n_buckets)
+                files = [open(os.path.join(work_dir, "%s%d.bin" % (name, i)), "wb")
+                         for i in range(first, last)]
+                try:
+                    for chunk in _chunks(arr, chunk_size):
+                        chunk = chunk.astype(dtype, copy=False)
+                        bucket = np.searchsorted(edges, chunk, side="right")
+                        if first or last < n_buckets:
+                            in_group = (bucket >= first) & (bucket < last)
+                            chunk, bucket = chunk[in_group], bucket[in_group]
+                        bucket -= first
+                        order = np.argsort(bucket, kind="stable")
+                        counts = np.bincount(bucket, minlength=last - first)
+                        sorted_chunk = chunk[order]
+                        start = 0
+                        for i, count in enumerate(counts):
+                            if count:
+                                files[i].write(sorted_chunk[start:start + count].tobytes())
+                            start += count
+                finally:
+                    for f in files:
+                        f.close()
+
+        # Pass 3: combine bucket by bucket into a raw result file
+        raw_path = os.path.join(work_dir, "result.bin")
+        written = 0
+        with open(raw_path, "wb") as out:
+            for i in range(n_buckets):
+                part_a = np.fromfile(os.path.join(work_dir, "a%d.bin" % i), dtype=dtype)
+                part_b = np.fromfile(os.path.join(work_dir, "b%d.bin" % i), dtype=dtype)
+                result = set_operation(op, part_a, part_b).astype(dtype, copy=False)
+                out.write(result.tobytes())
+                written += result.size
+
+        result = np.lib.format.open_memmap(out_path, mode="w+", dtype=dtype, shape=(written,))
+        raw = np.memmap(raw_path, dtype=dtype, mode="r", shape=(written,)) if written else []
+        for start in range(0, written, chunk_size):
+            result[start:start + chunk_size] = raw[start:start + chunk_size]
+        result.flush()
+        del result, raw
+        return written
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def loop_difference(array1, array2):
+    """The original Practice Q4 loop, kept for benchmarking"""
+    set_diff = []
+    for element in array1:
+        if element not in array2:
+            set_diff.append(element)
+    return np.array(set_diff)
+
+
+def benchmark(sizes=(10**4, 10**5, 10**6, 10**7, 10**8)):
+    rng = np.random.default_rng(0)
+    for n in sizes:
+        a = rng.integers(0, 2 * n, size=n)
+        b = rng.integers(0, 2 * n, size=n)
+        line = "n = %-9d" % n
+
+        if n <= 10**4:
+            start = time.perf_counter()
+            expected = np.unique(loop_difference(a, b))
+            line += " loop %.2f s," % (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        result = difference(a, b)
+        line += " table %.3f s" % (time.perf_counter() - start)
+
+        # The sort-based path gets slow for the largest sizes
+        if n <= 10**7:
+            start = time.perf_counter()
+            sorted_result = np.setdiff1d(a, b)
+            line += ", setdiff1d %.3f s" % (time.perf_counter() - start)
+            assert np.array_equal(result, sorted_result)
+        if n <= 10**4:
+            assert np.array_equal(result, expected)
+        print(line)
+        del a, b, result
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,157 @@
+"""Text statistics (vowels, consonants, spaces, lowercase letters) for strings
+and for large files.
+
+Instead of testing every character in Python, ASCII text is counted with
+bytes.translate()/bytes.count(), which run in C over whole chunks. Only
+non-ASCII characters (if any) are looked at one by one, with the same rules
+as Pra 6 Assignment 1. Files are read in fixed-size chunks and can be split
+across processes whose counts are added together.
+
+    python text_stats.py corpus.txt --workers 4 --letters
+"""
+
+import argparse
+import codecs
+import os
+import re
+import string
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+CHUNK_BYTES = 16 * 2**20
+STATS = ("vowels", "consonants", "spaces", "lowercase")
+
+_ALL_BYTES = bytes(range(256))
+_VOWELS = b"aeiouAEIOU"
+_LETTERS = string.ascii_letters.encode()
+_LOWERCASE = string.ascii_lowercase.encode()
+# Tables for bytes.translate(None, delete): remove everything *not* in the class
+_NOT_VOWEL = bytes(b for b in _ALL_BYTES if b not in _VOWELS)
+_NOT_LETTER = bytes(b for b in _ALL_BYTES if b not in _LETTERS)
+_NOT_LOWERCASE = bytes(b for b in _ALL_BYTES if b not in _LOWERCASE)
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _empty(letters=False):
+    stats = dict.fromkeys(STATS, 0)
+    if letters:
+        stats["letters"] = dict.fromkeys(string.ascii_lowercase, 0)
+    return stats
+
+
+def merge_stats(parts):
+    """Add up the statistics of several chunks or files"""
+    parts = list(parts)
+    total = _empty(any("letters" in p for p in parts))
+    for part in parts:
+        for key in STATS:
+            total[key] += part[key]
+        for letter, n in part.get("letters", {}).items():
+            total["letters"][letter] = total["letters"].get(letter, 0) + n
+    return total
+
+
+def _add_ascii(stats, data):
+    """Count an ASCII bytes block into stats"""
+    vowels = len(data.translate(None, _NOT_VOWEL))
+    letters = data.translate(None, _NOT_LETTER)
+    stats["vowels"] += vowels
+    stats["consonants"] += len(letters) - vowels
+    stats["spaces"] += data.count(b" ")
+    stats["lowercase"] += len(data.translate(None, _NOT_LOWERCASE))
+    if "letters" in stats:
+        histogram = stats["letters"]
+        folded = letters.lower()
+        for letter in histogram:
+            histogram[letter] += folded.count(letter.encode())
+
+
+def _add_text(stats, text):
+    """Count a str: ASCII part in bulk, other characters one by one"""
+    _add_ascii(stats, text.encode("ascii", "ignore"))
+    for ch in _NON_ASCII.findall(text):
+        if ch.lower() in "aeiou":
+            stats["vowels"] += 1
+        elif ch.isalpha():
+            stats["consonants"] += 1
+        if ch.islower():
+            stats["lowercase"] += 1
+
+
+def string_stats(text, letters=False):
+    """Statistics of one string"""
+    stats = _empty(letters)
+    _add_text(stats, text)
+    return stats
+
+
+def _range_stats(path, start, end, letters):
+    """Statistics of the bytes [start, end) of a UTF-8 file"""
+    stats = _empty(letters)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with open(path, "rb") as f:
+        f.seek(start)
+        pos = start
+        while pos < end:
+            chunk = f.read(min(CHUNK_BYTES, end - pos))
+            if not chunk:
+                break
+            pos += len(chunk)
+            if chunk.isascii() and not decoder.getstate()[0]:
+                _add_ascii(stats, chunk)
+            else:
+                _add_text(stats, decoder.decode(chunk))
+        _add_text(stats, decoder.decode(b"", final=True))
+    return stats
+
+
+def _split_points(path, parts):
+    """Byte offsets dividing a file into parts that start on a UTF-8 character"""
+    size = os.path.getsize(path)
+    points = [0]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            offset = max(size * i // parts, points[-1])
+            f.seek(offset)
+            # Move past UTF-8 continuation bytes (10xxxxxx)
+            for b in f.read(4):
+                if b & 0xC0 != 0x80:
+                    break
+                offset += 1
+            points.append(min(offset, size))
+    points.append(size)
+    return points
+
+
+def file_stats(path, workers=1, letters=False):
+    """Statistics of a UTF-8 text file, optionally split across processes"""
+    points = _split_points(path, max(1, workers))
+    jobs = [(path, points[i], points[i + 1], letters) for i in range(len(points) - 1)]
+    if workers <= 1:
+        return merge_stats(_range_stats(*job) for job in jobs)
+    with ProcessPoolExecutor(workers) as pool:
+        futures = [pool.submit(_range_stats, *job) for job in jobs]
+        return merge_stats(f.result() for f in futures)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Vowel/consonant/space/lowercase counts of text files")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--letters", action="store_true", help="also print a per-letter histogram")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = merge_stats(file_stats(p, args.workers, args.letters) for p in args.paths)
+    elapsed = time.perf_counter() - start
+    size = sum(os.path.getsize(p) for p in args.paths)
+
+    print("Number of Vowels:", stats["vowels"])
+    print("Number of Consonants:", stats["consonants"])
+    print("Number of Spaces:", stats["spaces"])
+    print("Number of Lowercase Letters:", stats["lowercase"])
+    if args.letters:
+        for letter, n in stats["letters"].items():
+            print("%s: %d" % (letter, n))
+    print("%.1f MB in %.2f s (%.0f MB/s)" % (size / 1e6, elapsed, size / 1e6 / elapsed if elapsed else 0))
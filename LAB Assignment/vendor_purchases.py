@@ -0,0 +1,174 @@
+"""Annual purchase/billing reports for many vendors (Pra 1 Assignment 2).
+
+Vendors are kept in a registry file (vendors.csv: vendor_id, name, year,
+contact, email). Purchases come from transaction logs, one purchase per line:
+
+    vendor_id,date,amount
+    V0001,2025-03-14,1520.50
+
+The logs are streamed in chunks and every purchase of the report year is
+added into a (vendors x 12) array of paise with one np.bincount per chunk,
+so memory depends on the number of vendors, not on the number of purchase
+lines. Several log files (e.g. one per vendor shard) can be aggregated in
+parallel processes and their arrays added together. Lines with an unknown
+vendor or a missing date/amount are skipped and counted.
+
+    python vendor_purchases.py vendors.csv logs/*.csv --year 2025 -o annual_report.csv
+"""
+
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+REGISTRY_FIELDS = ["vendor_id", "name", "year", "contact", "email"]
+CHUNK_ROWS = 2_000_000
+
+
+class Vendor:
+    __slots__ = ("vendor_id", "name", "year", "contact", "email")
+
+    def __init__(self, vendor_id, name, year="", contact="", email=""):
+        self.vendor_id = vendor_id
+        self.name = name
+        self.year = year
+        self.contact = contact
+        self.email = email
+
+    def __repr__(self):
+        return "Vendor(%r, %r)" % (self.vendor_id, self.name)
+
+
+class VendorRegistry:
+    """Vendors in a fixed order, so each has a row in the totals array"""
+
+    def __init__(self, vendors=()):
+        self.vendors = []
+        self.rows = {}  # vendor_id -> row
+        for vendor in vendors:
+            self.add(vendor)
+
+    def __len__(self):
+        return len(self.vendors)
+
+    def add(self, vendor):
+        if vendor.vendor_id in self.rows:
+            raise ValueError("Vendor %s is already registered" % vendor.vendor_id)
+        self.rows[vendor.vendor_id] = len(self.vendors)
+        self.vendors.append(vendor)
+        return vendor
+
+    @classmethod
+    def load(cls, path):
+        with open(path, newline="", encoding="utf-8") as f:
+            return cls(Vendor(**{k: row.get(k, "") for k in REGISTRY_FIELDS})
+                       for row in csv.DictReader(f))
+
+    def save(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(REGISTRY_FIELDS)
+            for v in self.vendors:
+                writer.writerow([getattr(v, k) for k in REGISTRY_FIELDS])
+
+
+def aggregate_log(path, vendor_ids, year, chunk_rows=CHUNK_ROWS):
+    """(vendors x 12) int64 paise totals of one purchase log for one year.
+
+    Returns (totals, unknown, missing) where unknown counts lines whose
+    vendor is not in vendor_ids and missing counts lines without a valid date
+    or amount (empty or not a plain number, e.g. "abc" or "1,200.50").
+    """
+    vendors = pd.Index(vendor_ids)
+    n = len(vendor_ids)
+    totals = np.zeros(n * 12, dtype=np.float64)  # whole paise, exact below 2**53
+    unknown = missing = 0
+    reader = pd.read_csv(path, usecols=["vendor_id", "date", "amount"],
+                         dtype={"vendor_id": str, "date": str, "amount": str},
+                         chunksize=chunk_rows)
+    for chunk in reader:
+        dates = pd.to_datetime(chunk["date"], format="%Y-%m-%d", errors="coerce")
+        amounts = pd.to_numeric(chunk["amount"], errors="coerce").to_numpy(dtype=np.float64)
+        rows = vendors.get_indexer(chunk["vendor_id"])
+        known = rows >= 0
+        valid = dates.notna().to_numpy() & np.isfinite(amounts)
+        unknown += int((~known).sum())
+        missing += int((known & ~valid).sum())
+        keep = known & valid & (dates.dt.year == year).to_numpy()
+        cells = rows[keep].astype(np.int64) * 12 + dates.dt.month.to_numpy()[keep].astype(np.int64) - 1
+        paise = np.rint(amounts[keep] * 100)
+        totals += np.bincount(cells, weights=paise, minlength=n * 12)
+    return totals.astype(np.int64).reshape(n, 12), unknown, missing
+
+
+def aggregate_logs(paths, registry, year, workers=1, chunk_rows=CHUNK_ROWS):
+    """Sum of aggregate_log over several files, in parallel when workers > 1"""
+    vendor_ids = [v.vendor_id for v in registry.vendors]
+    totals = np.zeros((len(vendor_ids), 12), dtype=np.int64)
+    unknown = missing = 0
+    jobs = [(path, vendor_ids, year, chunk_rows) for path in paths]
+    if workers <= 1 or len(jobs) <= 1:
+        results = [aggregate_log(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [pool.submit(aggregate_log, *job) for job in jobs]
+            results = [f.result() for f in futures]
+    for part, bad_vendor, bad_line in results:
+        totals += part
+        unknown += bad_vendor
+        missing += bad_line
+    return totals, unknown, missing
+
+
+def rupees(paise):
+    paise = int(paise)
+    return "%s%d.%02d" % (("-" if paise < 0 else "",) + divmod(abs(paise), 100))
+
+
+def write_report(registry, totals, out_path):
+    """Annual report of every vendor: details, monthly totals and the year's total"""
+    with open(out_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(REGISTRY_FIELDS + MONTHS + ["total"])
+        annual = totals.sum(axis=1)
+        for vendor, months, total in zip(registry.vendors, totals, annual):
+            writer.writerow([getattr(vendor, k) for k in REGISTRY_FIELDS]
+                            + [rupees(p) for p in months] + [rupees(total)])
+
+
+def print_report(vendor, months):
+    """The single-vendor report of Pra 1 Assignment 2"""
+    print("\nANNUAL PURCHASE REPORT")
+    print("Vendor Name:", vendor.name)
+    print("Year of Association:", vendor.year)
+    print("Contact Number:", vendor.contact)
+    print("Email ID:", vendor.email)
+    print("Total Annual Purchase:", rupees(sum(months)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Annual purchase reports for all vendors")
+    parser.add_argument("registry", help="vendors.csv")
+    parser.add_argument("logs", nargs="+", help="purchase log CSV files")
+    parser.add_argument("--year", type=int, required=True, help="year of the annual report")
+    parser.add_argument("-o", "--output", default="annual_report.csv")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    registry = VendorRegistry.load(args.registry)
+    totals, unknown, missing = aggregate_logs(args.logs, registry, args.year, args.workers, args.chunk_rows)
+    write_report(registry, totals, args.output)
+    print("Reported %d vendors to %s in %.2f s" % (len(registry), args.output, time.perf_counter() - start))
+    if unknown:
+        print("Skipped %d purchases from vendors not in %s" % (unknown, args.registry))
+    if missing:
+        print("Skipped %d purchases without a valid date or amount" % missing)
@@ -0,0 +1,125 @@
+import difflib
+import json
+import os
+import re
+import sys
+
+
+# Indian expense categories
+DEFAULT_CATEGORIES = ['Food & Groceries', 'Transportation', 'Entertainment', 'Utilities & Bills',
+                      'Healthcare', 'Shopping & Clothing', 'Education', 'Rent',
+                      'Mobile & Internet', 'Personal Care', 'Other']
+
+
+def category_key(text):
+    """Loose form of a category name used for matching ("food and groceries")"""
+    text = text.casefold().replace('&', ' and ')
+    return ' '.join(re.findall(r'[^\W_]+', text))
+
+
+class CategoryRegistry:
+    """Canonical category names with small integer ids.
+
+    Ids are positions in ``names`` and never change once assigned, so they
+    can be stored in the expense files instead of free text. Typed names are
+    matched against the registry (exact, alias, unique prefix, then fuzzy)
+    and the result is cached.
+
+    Writers that share the file should re-read it under the store's lock
+    before registering, or two processes can hand out the same id.
+    """
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.names = []
+        self.aliases = {}
+        self._ids = {}
+        self._cache = {}
+        self.changed = False
+
+        if filename and os.path.exists(filename):
+            with open(filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for name in data.get('categories', []):
+                self._register(name)
+            for alias, name in data.get('aliases', {}).items():
+                self.add_alias(alias, name)
+            self.changed = False
+        else:
+            for name in DEFAULT_CATEGORIES:
+                self._register(name)
+
+    def _register(self, name):
+        name = sys.intern(name)
+        self._ids[name] = len(self.names)
+        self.names.append(name)
+        self.aliases.setdefault(category_key(name), name)
+        self._cache.clear()
+        self.changed = True
+        return self._ids[name]
+
+    def add(self, name):
+        """Add a user category (if new) and return its canonical name"""
+        name = ' '.join(name.split())
+        existing = self.aliases.get(category_key(name))
+        if existing is not None:
+            return existing
+        return self.names[self._register(name)]
+
+    def add_alias(self, alias, name):
+        """Make another spelling resolve to an existing category"""
+        self.aliases[category_key(alias)] = self.names[self._ids[name]]
+        self._cache.clear()
+        self.changed = True
+
+    def match(self, text):
+        """Return the canonical name for a typed category, or None"""
+        if text in self._cache:
+            return self._cache[text]
+
+        key = category_key(text)
+        name = self.aliases.get(key)
+        if name is None and len(key) >= 3:
+            prefixed = {n for k, n in self.aliases.items() if k.startswith(key)}
+            if len(prefixed) == 1:
+                name = prefixed.pop()
+        if name is None:
+            close = difflib.get_close_matches(key, self.aliases, n=1, cutoff=0.85)
+            if close:
+                name = self.aliases[close[0]]
+
+        self._cache[text] = name
+        return name
+
+    def normalise(self, text):
+        """Canonical name for a typed category, registering it if unknown"""
+        name = self.match(text)
+        if name is None:
+            name = self.add(text)
+            self._cache[text] = name
+        return name
+
+    def id_for(self, text):
+        """Small integer id for a (possibly non-canonical) category name"""
+        return self._ids[self.normalise(text)]
+
+    def name_for(self, category_id):
+        return self.names[category_id]
+
+    def save(self):
+        """Write the registry if categories or aliases were added"""
+        if not self.filename or not self.changed:
+            return
+        aliases = {alias: name for alias, name in self.aliases.items()
+                   if alias != category_key(name)}
+        tmp_path = f'{self.filename}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'categories': self.names, 'aliases': aliases}, f,
+                          indent=4, ensure_ascii=False)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, self.filename)
+        self.changed = False
@@ -0,0 +1,271 @@
+"""
+Non-interactive command line interface for the expense tracker.
+
+Every command prints JSON (default) or CSV and exits, so it can be driven
+from scripts and cron jobs instead of piping keystrokes into the menu.
+
+    python expense_cli.py add 500 "Food & Groceries" "Swiggy dinner" --date 2026-01-27
+    python expense_cli.py import bank_statement.csv
+    python expense_cli.py view --month 1 --year 2026 --format csv
+    python expense_cli.py report --month 1 --year 2026
+    python expense_cli.py totals --by category --year 2026
+    python expense_cli.py chart bar --year 2026
+    python expense_cli.py forecast
+    python expense_cli.py dashboard --output expense_dashboard.html
+    python expense_cli.py watch --interval 0.5
+
+Only the yearly partitions needed by a command are read, and Matplotlib is
+only imported by the chart command.
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import sys
+from collections import defaultdict
+from datetime import datetime
+from expense_storage import open_store
+
+
+FIELDS = ['date', 'amount', 'category', 'description']
+
+
+def select_expenses(store, month=None, year=None):
+    """Expenses for a month/year, a whole year, or everything"""
+    if year is None:
+        expenses = store.load_all()
+    else:
+        expenses = store.load_year(year)
+    if month is not None:
+        expenses = [exp for exp in expenses if int(exp['date'][5:7]) == month]
+    return expenses
+
+
+def make_expense(amount, category, description, date=None):
+    """Build a validated expense record"""
+    if not date:
+        date = datetime.now().strftime('%Y-%m-%d')
+    datetime.strptime(date, '%Y-%m-%d')
+    return {
+        'date': date,
+        'amount': float(amount),
+        'category': category,
+        'description': description
+    }
+
+
+def read_import_file(path):
+    """Read expenses from a CSV (with a header row) or JSON list file"""
+    if path.endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            rows = json.load(f)
+    else:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+    for row in rows:
+        yield make_expense(row['amount'], row['category'],
+                           row.get('description', ''), row.get('date'))
+
+
+def emit(rows, columns, fmt, out=sys.stdout):
+    """Print a list of dicts as JSON or CSV"""
+    if fmt == 'csv':
+        writer = csv.DictWriter(out, fieldnames=columns, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        json.dump(rows, out, ensure_ascii=False)
+        out.write('\n')
+
+
+def cmd_add(store, args):
+    expense = make_expense(args.amount, args.category, args.description, args.date)
+    with store.locked():
+        store.add(expense)
+        store.save()
+    emit([expense], FIELDS, args.format)
+
+
+def cmd_import(store, args):
+    expenses = list(read_import_file(args.path))
+    with store.locked():
+        for expense in expenses:
+            store.add(expense)
+        store.save()
+    count = len(expenses)
+    emit([{'imported': count}], ['imported'], args.format)
+
+
+def cmd_view(store, args):
+    emit(select_expenses(store, args.month, args.year), FIELDS, args.format)
+
+
+def cmd_totals(store, args):
+    totals = defaultdict(float)
+    for exp in select_expenses(store, args.month, args.year):
+        if args.by == 'month':
+            key = exp['date'][:7]
+        else:
+            key = exp['category']
+        totals[key] += exp['amount']
+
+    rows = [{args.by: key, 'amount': round(amount, 2)}
+            for key, amount in sorted(totals.items())]
+    emit(rows, [args.by, 'amount'], args.format)
+
+
+def cmd_report(store, args):
+    expenses = select_expenses(store, args.month, args.year)
+    total = sum(exp['amount'] for exp in expenses)
+    category_totals = defaultdict(float)
+    for exp in expenses:
+        category_totals[exp['category']] += exp['amount']
+
+    rows = []
+    for category, amount in sorted(category_totals.items(),
+                                   key=lambda x: x[1], reverse=True):
+        rows.append({
+            'month': args.month,
+            'year': args.year,
+            'category': category,
+            'amount': round(amount, 2),
+            'percentage': round(amount / total * 100, 1) if total else 0.0,
+            'transactions': len(expenses),
+            'total': round(total, 2),
+        })
+    emit(rows, ['month', 'year', 'category', 'amount', 'percentage',
+                'transactions', 'total'], args.format)
+
+
+def cmd_chart(store, args):
+    import warnings
+    import matplotlib
+    matplotlib.use('Agg')
+    warnings.filterwarnings('ignore', message='.*non-interactive.*')
+    from expense_tracker import ExpenseTracker
+
+    tracker = ExpenseTracker(args.file, store=store)
+
+    # Keep stdout machine-readable: the tracker's messages go to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        if args.kind == 'bar':
+            tracker.generate_monthly_bar_chart(args.year)
+            output = 'monthly_expenses_bar_chart.png'
+        elif args.kind == 'category':
+            tracker.generate_category_bar_chart(args.month, args.year)
+            output = 'category_bar_chart.png'
+        else:
+            tracker.generate_category_pie_chart(args.month, args.year)
+            output = 'expense_pie_chart.png'
+    emit([{'chart': output}], ['chart'], args.format)
+
+
+def cmd_watch(store, args):
+    from expense_watch import ExpenseWatcher
+
+    def print_totals(new_expenses, totals):
+        print(json.dumps(totals.as_dict(), ensure_ascii=False), flush=True)
+
+    watcher = ExpenseWatcher(store, interval=args.interval)
+    print_totals([], watcher.totals)
+    try:
+        watcher.watch(print_totals, max_polls=args.polls)
+    except KeyboardInterrupt:
+        pass
+
+
+def cmd_forecast(store, args):
+    from expense_forecast import forecast_next_month
+
+    forecast = forecast_next_month(store.load_all(), window=args.window)
+    rows = [{'month': forecast['month'], 'category': category, 'amount': amount}
+            for category, amount in sorted(forecast['by_category'].items())]
+    emit(rows, ['month', 'category', 'amount'], args.format)
+
+
+def cmd_dashboard(store, args):
+    from expense_dashboard import export_dashboard
+
+    with contextlib.redirect_stdout(sys.stderr):
+        output = export_dashboard(store, args.output)
+    emit([{'dashboard': output}], ['dashboard'], args.format)
+
+
+def build_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--file', default='expenses.json',
+                        help='expense data file (default: expenses.json)')
+    common.add_argument('--format', choices=['json', 'csv'], default='json')
+
+    parser = argparse.ArgumentParser(description='Personal Expense Tracker (non-interactive)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('add', parents=[common], help='add one expense')
+    add.add_argument('amount', type=float)
+    add.add_argument('category')
+    add.add_argument('description', nargs='?', default='')
+    add.add_argument('--date', help='YYYY-MM-DD (default: today)')
+    add.set_defaults(func=cmd_add)
+
+    imp = commands.add_parser('import', parents=[common], help='import expenses from CSV or JSON')
+    imp.add_argument('path')
+    imp.set_defaults(func=cmd_import)
+
+    for name, func, help_text in [('view', cmd_view, 'list expenses'),
+                                  ('report', cmd_report, 'monthly summary by category'),
+                                  ('totals', cmd_totals, 'total spending by category or month')]:
+        sub = commands.add_parser(name, parents=[common], help=help_text)
+        sub.add_argument('--month', type=int, choices=range(1, 13), metavar='1-12')
+        sub.add_argument('--year', type=int)
+        sub.set_defaults(func=func)
+        if name == 'totals':
+            sub.add_argument('--by', choices=['category', 'month'], default='category')
+
+    chart = commands.add_parser('chart', parents=[common], help='save a chart as PNG')
+    chart.add_argument('kind', choices=['bar', 'pie', 'category'])
+    chart.add_argument('--month', type=int, choices=range(1, 13), metavar='1-12')
+    chart.add_argument('--year', type=int,
+                       help='year to chart (pie/category: the whole year unless --month is given)')
+    chart.set_defaults(func=cmd_chart)
+
+    forecast = commands.add_parser('forecast', parents=[common],
+                                   help="project next month's spending per category")
+    forecast.add_argument('--window', type=int, default=3, help='moving average window (months)')
+    forecast.set_defaults(func=cmd_forecast)
+
+    dashboard = commands.add_parser('dashboard', parents=[common],
+                                    help='write a self-contained HTML dashboard')
+    dashboard.add_argument('--output', default='expense_dashboard.html')
+    dashboard.set_defaults(func=cmd_dashboard)
+
+    watch = commands.add_parser('watch', parents=[common],
+                                help='print running totals (JSON lines) whenever data changes')
+    watch.add_argument('--interval', type=float, default=0.5, help='seconds between polls')
+    watch.add_argument('--polls', type=int, help='stop after this many polls')
+    watch.set_defaults(func=cmd_watch)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if getattr(args, 'month', None) is not None and args.year is None:
+        parser.error('--month needs --year')
+    if args.command == 'chart' and args.kind == 'bar' and args.year is None:
+        args.year = datetime.now().year
+    if args.command == 'report' and (args.month is None or args.year is None):
+        parser.error('report needs --month and --year')
+
+    try:
+        args.func(open_store(args.file), args)
+    except (ValueError, KeyError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
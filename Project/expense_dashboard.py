@@ -0,0 +1,201 @@
+"""
+Self-contained HTML dashboard built from pre-aggregated data.
+
+The page embeds month x category totals as JSON and draws its charts as
+SVG in the browser, so nothing is rendered with Matplotlib and the file
+can be opened straight from disk.
+
+Aggregates are cached per yearly partition in ``<data dir>/aggregates.json``
+next to the file stamp they were computed from. Re-exporting only reads the
+partitions that changed since the last export (normally just the current
+year); closed, compressed years are never decompressed again.
+
+    python expense_cli.py dashboard --output expense_dashboard.html
+"""
+
+import json
+import os
+from collections import defaultdict
+from datetime import datetime
+
+
+def aggregate_year(expenses):
+    """{'YYYY-MM': {category: total}} for one year's expenses"""
+    totals = defaultdict(lambda: defaultdict(float))
+    for exp in expenses:
+        totals[exp['date'][:7]][exp['category']] += exp['amount']
+    return {month: {c: round(v, 2) for c, v in cats.items()}
+            for month, cats in sorted(totals.items())}
+
+
+def load_aggregates(store):
+    """Month x category totals for every year, reusing cached years"""
+    cache_file = os.path.join(store.directory, 'aggregates.json')
+    cache = {}
+    if os.path.exists(cache_file):
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+
+    aggregates = {}
+    changed = False
+    for year in store.years():
+        key = str(year)
+        stamp = store.partition_stamp(year)
+        entry = cache.get(key)
+        if entry is None or entry['stamp'] != stamp:
+            entry = {'stamp': stamp, 'months': aggregate_year(store.load_year(year))}
+            cache[key] = entry
+            changed = True
+        aggregates.update(entry['months'])
+
+    for key in set(cache) - {str(year) for year in store.years()}:
+        del cache[key]
+        changed = True
+
+    if changed:
+        # Per-process temp name: concurrent exports never share a temp file
+        tmp_path = f'{cache_file}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, cache_file)
+    return aggregates
+
+
+def export_dashboard(store, output='expense_dashboard.html'):
+    """Write the dashboard HTML and return its path"""
+    data = {
+        'generated': datetime.now().strftime('%Y-%m-%d %H:%M'),
+        'months': load_aggregates(store),
+    }
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    # Keep the JSON from closing the <script> element early
+    payload = payload.replace('</', '<\\/')
+
+    html = DASHBOARD_TEMPLATE.replace('/*DATA*/null', payload)
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(html)
+    print(f"✓ Dashboard saved as '{output}'")
+    return output
+
+
+DASHBOARD_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Personal Expense Tracker - Dashboard</title>
+<style>
+  body { font-family: Segoe UI, Arial, sans-serif; margin: 24px; color: #222; background: #fafafa; }
+  h1 { margin-bottom: 4px; }
+  .muted { color: #777; font-size: 13px; }
+  .panel { background: #fff; border: 1px solid #ddd; border-radius: 6px; padding: 16px; margin: 16px 0; }
+  .cards { display: flex; gap: 16px; flex-wrap: wrap; }
+  .card { flex: 1; min-width: 160px; background: #fff; border: 1px solid #ddd; border-radius: 6px; padding: 12px; }
+  .card b { display: block; font-size: 22px; }
+  select { font-size: 15px; padding: 2px 6px; }
+  table { border-collapse: collapse; width: 100%; }
+  td, th { padding: 4px 8px; border-bottom: 1px solid #eee; text-align: left; }
+  td.num { text-align: right; }
+  svg text { font-size: 11px; }
+</style>
+</head>
+<body>
+<h1>Personal Expense Tracker</h1>
+<div class="muted">Generated <span id="generated"></span></div>
+
+<div class="panel">
+  Year <select id="year"></select>
+  Month <select id="month"><option value="">All</option></select>
+</div>
+
+<div class="cards">
+  <div class="card">Total spent<b id="total"></b></div>
+  <div class="card">Months with spending<b id="active"></b></div>
+  <div class="card">Top category<b id="top"></b></div>
+</div>
+
+<div class="panel"><h3>Monthly expenses</h3><svg id="monthly" width="100%" height="260"></svg></div>
+<div class="panel"><h3>Expenses by category</h3><svg id="categories" width="100%" height="60"></svg></div>
+<div class="panel"><h3>All years</h3><svg id="yearly" width="100%" height="220"></svg></div>
+
+<script>
+const DATA = /*DATA*/null;
+const MONTHS = ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'];
+const SVGNS = 'http://www.w3.org/2000/svg';
+const rupees = v => '\\u20b9' + v.toLocaleString('en-IN', {maximumFractionDigits: 0});
+const sum = obj => Object.values(obj).reduce((a, b) => a + b, 0);
+
+function el(svg, name, attrs, text) {
+  const node = document.createElementNS(SVGNS, name);
+  for (const k in attrs) node.setAttribute(k, attrs[k]);
+  if (text !== undefined) node.textContent = text;
+  svg.appendChild(node);
+  return node;
+}
+
+function columnChart(svg, labels, values, color) {
+  svg.innerHTML = '';
+  const width = svg.clientWidth || 800, height = svg.clientHeight || 240;
+  const max = Math.max(1, ...values), slot = (width - 40) / Math.max(1, labels.length);
+  labels.forEach((label, i) => {
+    const h = (height - 50) * values[i] / max, x = 30 + i * slot;
+    el(svg, 'rect', {x: x + slot * 0.15, y: height - 30 - h, width: slot * 0.7, height: h, fill: color});
+    el(svg, 'text', {x: x + slot / 2, y: height - 14, 'text-anchor': 'middle'}, label);
+    if (values[i] > 0)
+      el(svg, 'text', {x: x + slot / 2, y: height - 34 - h, 'text-anchor': 'middle'}, rupees(values[i]));
+  });
+}
+
+function barChart(svg, rows) {
+  svg.innerHTML = '';
+  const width = svg.clientWidth || 800, rowHeight = 24;
+  svg.setAttribute('height', Math.max(40, rows.length * rowHeight + 10));
+  const max = Math.max(1, ...rows.map(r => r[1])), left = 170;
+  rows.forEach(([label, value], i) => {
+    const y = 5 + i * rowHeight, w = (width - left - 90) * value / max;
+    el(svg, 'text', {x: left - 8, y: y + 15, 'text-anchor': 'end'}, label);
+    el(svg, 'rect', {x: left, y: y + 3, width: w, height: rowHeight - 8, fill: '#c0392b'});
+    el(svg, 'text', {x: left + w + 6, y: y + 15}, rupees(value));
+  });
+}
+
+function render() {
+  const year = document.getElementById('year').value;
+  const month = document.getElementById('month').value;
+  const monthly = MONTHS.map((_, i) => DATA.months[year + '-' + String(i + 1).padStart(2, '0')] || {});
+  const selected = month ? [monthly[month - 1]] : monthly;
+
+  const byCategory = {};
+  selected.forEach(m => { for (const c in m) byCategory[c] = (byCategory[c] || 0) + m[c]; });
+  const rows = Object.entries(byCategory).sort((a, b) => b[1] - a[1]);
+  const total = sum(byCategory);
+
+  document.getElementById('total').textContent = rupees(total);
+  document.getElementById('active').textContent = monthly.filter(m => sum(m) > 0).length;
+  document.getElementById('top').textContent = rows.length ? rows[0][0] : '-';
+  columnChart(document.getElementById('monthly'), MONTHS, monthly.map(sum), '#2e86c1');
+  barChart(document.getElementById('categories'), rows);
+}
+
+const years = [...new Set(Object.keys(DATA.months).map(k => k.slice(0, 4)))].sort();
+const yearTotals = years.map(y => Object.keys(DATA.months)
+  .filter(k => k.startsWith(y)).reduce((a, k) => a + sum(DATA.months[k]), 0));
+
+document.getElementById('generated').textContent = DATA.generated;
+const yearSelect = document.getElementById('year');
+years.forEach(y => yearSelect.add(new Option(y, y)));
+yearSelect.value = years[years.length - 1] || '';
+MONTHS.forEach((m, i) => document.getElementById('month').add(new Option(m, i + 1)));
+yearSelect.onchange = render;
+document.getElementById('month').onchange = render;
+
+columnChart(document.getElementById('yearly'), years, yearTotals, '#16a085');
+render();
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,170 @@
+"""
+Spending forecast and trend analysis.
+
+All expenses are folded into one month x category matrix, and every
+statistic (moving average, linear trend, seasonal index, next-month
+forecast) is computed for all categories at once with NumPy.
+
+    from expense_tracker import ExpenseTracker
+    from expense_forecast import forecast_next_month, generate_forecast_chart
+
+    tracker = ExpenseTracker()
+    forecast = forecast_next_month(tracker.expenses)
+    generate_forecast_chart(tracker.expenses)
+"""
+
+import numpy as np
+
+
+def month_number(date):
+    """'YYYY-MM-DD' -> months since year 0 (so consecutive months differ by 1)"""
+    return int(date[:4]) * 12 + int(date[5:7]) - 1
+
+
+def month_label(number):
+    return f"{number // 12}-{number % 12 + 1:02d}"
+
+
+def build_matrix(expenses):
+    """Return (months, categories, matrix) with matrix[month, category] totals.
+
+    Months run without gaps from the first to the last expense, so a month
+    with no spending is a row of zeros rather than missing.
+    """
+    if not expenses:
+        return [], [], np.zeros((0, 0))
+
+    category_ids = {}
+    month_idx = np.fromiter((month_number(exp['date']) for exp in expenses),
+                            dtype=np.int64, count=len(expenses))
+    cat_idx = np.fromiter((category_ids.setdefault(exp['category'], len(category_ids))
+                           for exp in expenses), dtype=np.int64, count=len(expenses))
+    amounts = np.fromiter((exp['amount'] for exp in expenses),
+                          dtype=np.float64, count=len(expenses))
+
+    first = month_idx.min()
+    n_months = month_idx.max() - first + 1
+    n_categories = len(category_ids)
+
+    # One bincount over the flattened (month, category) cell index
+    cells = (month_idx - first) * n_categories + cat_idx
+    matrix = np.bincount(cells, weights=amounts, minlength=n_months * n_categories)
+    matrix = matrix.reshape(n_months, n_categories)
+
+    months = [month_label(first + i) for i in range(n_months)]
+    return months, list(category_ids), matrix
+
+
+def moving_average(matrix, window=3):
+    """Trailing moving average down each column (first rows use what exists)"""
+    csum = np.cumsum(matrix, axis=0)
+    csum = np.vstack([np.zeros((1, matrix.shape[1])), csum])
+    rows = np.arange(1, matrix.shape[0] + 1)
+    start = np.maximum(rows - window, 0)
+    counts = (rows - start)[:, None]
+    return (csum[rows] - csum[start]) / counts
+
+
+def linear_trend(matrix):
+    """Least-squares slope and intercept per column against the month index"""
+    n = matrix.shape[0]
+    if n < 2:
+        return np.zeros(matrix.shape[1]), matrix.sum(axis=0)
+    t = np.arange(n, dtype=np.float64)
+    t_centered = t - t.mean()
+    slope = t_centered @ (matrix - matrix.mean(axis=0)) / (t_centered @ t_centered)
+    intercept = matrix.mean(axis=0) - slope * t.mean()
+    return slope, intercept
+
+
+def seasonal_indices(matrix, first_month):
+    """12 x category ratio of each calendar month's mean to the overall mean.
+
+    ``first_month`` is the calendar month (1-12) of the first matrix row.
+    Months never observed, and categories with no spending, get an index of 1.
+    """
+    n_months, n_categories = matrix.shape
+    calendar = (np.arange(n_months) + first_month - 1) % 12
+
+    sums = np.zeros((12, n_categories))
+    np.add.at(sums, calendar, matrix)
+    counts = np.bincount(calendar, minlength=12)[:, None]
+
+    overall = matrix.mean(axis=0) if n_months else np.zeros(n_categories)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        indices = (sums / counts) / overall
+    return np.where(np.isfinite(indices), indices, 1.0)
+
+
+def forecast_matrix(matrix, first_month, window=3):
+    """Next-month forecast per column: trend projection adjusted by season.
+
+    Seasonal adjustment is only applied once there are two full years of
+    data; before that the forecast is the plain trend (or moving average).
+    """
+    n_months = matrix.shape[0]
+    slope, intercept = linear_trend(matrix)
+    trend = intercept + slope * n_months
+
+    if n_months < 3:
+        trend = moving_average(matrix, window)[-1]
+    if n_months >= 24:
+        next_calendar = (n_months + first_month - 1) % 12
+        trend = trend * seasonal_indices(matrix, first_month)[next_calendar]
+    return np.maximum(trend, 0.0)
+
+
+def forecast_next_month(expenses, window=3):
+    """Return {'month': 'YYYY-MM', 'by_category': {...}, 'total': x}"""
+    months, categories, matrix = build_matrix(expenses)
+    if not months:
+        return {'month': None, 'by_category': {}, 'total': 0.0}
+
+    first_month = int(months[0][5:7])
+    forecast = forecast_matrix(matrix, first_month, window)
+    next_month = month_label(month_number(months[-1] + '-01') + 1)
+    return {
+        'month': next_month,
+        'by_category': {c: round(float(v), 2) for c, v in zip(categories, forecast)},
+        'total': round(float(forecast.sum()), 2),
+    }
+
+
+def generate_forecast_chart(expenses, window=3, history=24):
+    """Line chart of actual monthly spending, its moving average and the forecast"""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    months, _, matrix = build_matrix(expenses)
+    if not months:
+        print("No data to visualize.")
+        return
+
+    first_month = int(months[0][5:7])
+    forecast = forecast_matrix(matrix, first_month, window)
+    totals = matrix.sum(axis=1)
+    smoothed = moving_average(totals[:, None], window)[:, 0]
+    next_month = month_label(month_number(months[-1] + '-01') + 1)
+
+    months, totals, smoothed = months[-history:], totals[-history:], smoothed[-history:]
+    x = np.arange(len(months))
+
+    sns.set_style("whitegrid")
+    plt.figure(figsize=(12, 6))
+    plt.plot(x, totals, marker='o', label='Actual')
+    plt.plot(x, smoothed, linestyle='--', label=f'{window}-month average')
+    plt.plot([x[-1], x[-1] + 1], [totals[-1], forecast.sum()],
+             marker='o', linestyle=':', color='red', label='Forecast')
+    plt.text(x[-1] + 1, forecast.sum(), f'₹{forecast.sum():.0f}',
+             ha='center', va='bottom', fontsize=9)
+
+    plt.xticks(list(x) + [x[-1] + 1], months + [next_month], rotation=45)
+    plt.xlabel('Month', fontsize=12, fontweight='bold')
+    plt.ylabel('Total Expenses (₹)', fontsize=12, fontweight='bold')
+    plt.title(f'Actual vs Forecast Expenses (forecast for {next_month})',
+              fontsize=16, fontweight='bold')
+    plt.legend()
+    plt.tight_layout()
+    plt.savefig('forecast_chart.png', dpi=300, bbox_inches='tight')
+    plt.show()
+    print("✓ Forecast chart saved as 'forecast_chart.png'")
@@ -0,0 +1,459 @@
+import contextlib
+import json
+import lzma
+import os
+import re
+from datetime import datetime
+from expense_categories import CategoryRegistry
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+
+PARTITION_PATTERN = re.compile(r'^expenses_(\d{4})\.(?:jsonl|json|json\.xz)$')
+PARTITION_SUFFIXES = ('.jsonl', '.json', '.json.xz')
+
+
+def _complete_length(path):
+    """Length of a journal up to and including its last newline"""
+    with open(path, 'rb') as f:
+        end = f.seek(0, os.SEEK_END)
+        while end:
+            start = max(0, end - 65536)
+            f.seek(start)
+            cut = f.read(end - start).rfind(b'\n')
+            if cut != -1:
+                return start + cut + 1
+            end = start
+    return 0
+
+
+class PartitionedExpenseStore:
+    """Store expenses in one file per year.
+
+    The current year is a JSON Lines journal (``expenses_<year>.jsonl``):
+    adding expenses appends lines, and other processes pick up just the new
+    bytes. Closed (past) years are compressed JSON (``.json.xz``) and only
+    read when a query actually asks for that year. Plain ``.json`` arrays
+    from older versions are still read and converted on open.
+
+    On disk each record stores its category as an id from the category
+    registry; in memory the id is decoded back to the canonical name.
+
+    Several processes may share a store (CLI calls, the interactive
+    tracker, the watcher). Writers hold ``locked()`` around their
+    read-modify-save so no one rewrites a partition from a stale copy.
+    """
+
+    def __init__(self, directory, current_year=None):
+        self.directory = directory
+        self.current_year = current_year or datetime.now().year
+        self._partitions = {}
+        self._dirty = set()
+        self._stamps = {}
+        self._saved = {}   # year -> records already in its journal
+        self._tails = {}   # year -> (inode, offset, last line) of its journal
+        self._pending = {}  # year -> records added to a journal that was never loaded
+        self._lock_file = None
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.registry_file = os.path.join(self.directory, 'categories.json')
+        self._acquire_lock()
+        try:
+            needs_migration = not os.path.exists(self.registry_file)
+            self.categories = CategoryRegistry(self.registry_file)
+            if needs_migration:
+                self.migrate_categories()
+            self.compress_closed_years()
+            for name in self._files_on_disk().values():
+                self._stamps.setdefault(name, self._stamp(name))
+            self._stamps['categories.json'] = self._stamp('categories.json')
+        finally:
+            self._release_lock()
+
+    def _acquire_lock(self):
+        """Take the exclusive lock on the store; True if this call took it"""
+        if self._lock_file is not None:
+            return False
+        self._lock_file = open(os.path.join(self.directory, '.lock'), 'a')
+        if fcntl is not None:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+        return True
+
+    def _release_lock(self):
+        if self._lock_file is not None:
+            # Closing the file drops the flock
+            self._lock_file.close()
+            self._lock_file = None
+
+    @contextlib.contextmanager
+    def locked(self):
+        """Hold the store's exclusive lock, first catching up on other writers.
+
+        Use it around add()/replace() and the save() that follows; nested
+        use is a no-op.
+        """
+        if not self._acquire_lock():
+            yield self
+            return
+        try:
+            # Always re-read the registry so new categories get fresh ids
+            self.categories = CategoryRegistry(self.registry_file)
+            self._stamps['categories.json'] = self._stamp('categories.json')
+            self.refresh()
+            yield self
+        finally:
+            self._release_lock()
+
+    def _path(self, year, compressed=None):
+        """Path of the partition file for a year"""
+        if compressed is None:
+            compressed = year < self.current_year
+        suffix = '.json.xz' if compressed else '.jsonl'
+        return os.path.join(self.directory, f'expenses_{year}{suffix}')
+
+    def _remove_other_formats(self, year, keep):
+        """Delete the year's files other than ``keep``"""
+        for suffix in PARTITION_SUFFIXES:
+            path = os.path.join(self.directory, f'expenses_{year}{suffix}')
+            if path != keep and os.path.exists(path):
+                os.remove(path)
+
+    def _files_on_disk(self):
+        """Map year -> partition file name for every partition on disk.
+
+        If a save was interrupted after writing a year's new file but before
+        removing its old one, the file in the expected format wins.
+        """
+        files = {}
+        for name in os.listdir(self.directory):
+            match = PARTITION_PATTERN.match(name)
+            if match:
+                year = int(match.group(1))
+                if year not in files or name == os.path.basename(self._path(year)):
+                    files[year] = name
+        return files
+
+    def partition_stamp(self, year):
+        """(inode, mtime, size) of a year's partition file, None if it has none"""
+        name = self._files_on_disk().get(year)
+        return None if name is None else list(self._stamp(name))
+
+    def years(self):
+        """All years that have (or will have) a partition, oldest first"""
+        return sorted(set(self._files_on_disk()) | set(self._partitions) | set(self._pending))
+
+    def _stamp(self, name):
+        """(inode, mtime, size) of a file in the store, None if missing"""
+        try:
+            st = os.stat(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _decode(self, year, expenses):
+        """Turn category ids back into names"""
+        names = self.categories.names
+        for exp in expenses:
+            category = exp['category']
+            if isinstance(category, int):
+                exp['category'] = names[category]
+            else:
+                # Free-text category from an older file: re-code on next save
+                exp['category'] = self.categories.normalise(category)
+                self._dirty.add(year)
+        return expenses
+
+    def _read_partition(self, year, name):
+        """Read and decode one partition file"""
+        path = os.path.join(self.directory, name)
+        if name.endswith('.jsonl'):
+            return self._read_journal(year, name, (None, 0, b''))
+
+        stamp = self._stamp(name)
+        opener = lzma.open if name.endswith('.xz') else open
+        with opener(path, 'rt', encoding='utf-8') as f:
+            expenses = json.load(f)
+        self._stamps[name] = stamp
+        self._saved.pop(year, None)
+        self._tails.pop(year, None)
+        return self._decode(year, expenses)
+
+    def _read_journal(self, year, name, tail):
+        """Records of a journal after ``tail`` = (inode, offset, last line).
+
+        Returns None if the file is no longer that journal plus appended
+        lines (replaced, truncated, or the bytes before the offset differ).
+        A torn last line (writer crashed or still writing) is left for later.
+        """
+        inode, offset, last = tail
+        with open(os.path.join(self.directory, name), 'rb') as f:
+            st = os.fstat(f.fileno())
+            if inode is not None:
+                if st.st_ino != inode or st.st_size < offset:
+                    return None
+                f.seek(offset - len(last))
+                if f.read(len(last)) != last:
+                    return None
+            data = f.read()
+        end = data.rfind(b'\n') + 1
+        lines = data[:end].splitlines(keepends=True)
+        if lines:
+            last = lines[-1]
+        self._stamps[name] = (st.st_ino, st.st_mtime_ns, st.st_size)
+        self._tails[year] = (st.st_ino, offset + end, last)
+        self._saved[year] = self._saved.get(year, 0) if inode is not None else 0
+        self._saved[year] += len(lines)
+        return self._decode(year, [json.loads(line) for line in lines])
+
+    def load_year(self, year):
+        """Return the expenses of one year, reading its partition on first use"""
+        if year in self._partitions:
+            return self._partitions[year]
+
+        name = self._files_on_disk().get(year)
+        expenses = []
+        if name is not None:
+            expenses = self._read_partition(year, name)
+        elif self._path(year).endswith('.jsonl'):
+            self._saved[year] = 0
+            self._tails.pop(year, None)
+        expenses.extend(self._pending.pop(year, ()))
+
+        self._partitions[year] = expenses
+        return expenses
+
+    def load_all(self):
+        """Return every expense across all partitions"""
+        expenses = []
+        for year in self.years():
+            expenses.extend(self.load_year(year))
+        return expenses
+
+    def add(self, expense):
+        """Append an expense to the partition of its year"""
+        year = int(expense['date'][:4])
+        expense['category'] = self.categories.normalise(expense['category'])
+        if year in self._pending or (year not in self._partitions and self._journal_only(year)):
+            # Appending to a journal does not need its earlier records
+            self._pending.setdefault(year, []).append(expense)
+            return
+        self.load_year(year).append(expense)
+        if year not in self._saved:
+            # Not a journal: the whole file is rewritten on save
+            self._dirty.add(year)
+
+    def _journal_only(self, year):
+        """True if the year is (or will be) stored as a journal and nothing else"""
+        path = self._path(year)
+        name = self._files_on_disk().get(year)
+        return path.endswith('.jsonl') and name in (None, os.path.basename(path))
+
+    def replace(self, expenses):
+        """Replace the whole data set, e.g. when clearing all data"""
+        self._dirty.update(self.years())
+        self._pending.clear()
+        self._partitions = {year: [] for year in self._dirty}
+        for expense in expenses:
+            self.add(expense)
+
+    def save(self):
+        """Write every partition that changed since the last save.
+
+        Journals only get their new records appended; other changed
+        partitions are rewritten.
+        """
+        # New category ids must be on disk before any partition that uses them
+        self.categories.save()
+        self._stamps['categories.json'] = self._stamp('categories.json')
+        for year in sorted(self._dirty):
+            expenses = self._partitions.get(year, [])
+            path = self._path(year)
+            if expenses:
+                self._write(year, path, expenses)
+            else:
+                if os.path.exists(path):
+                    os.remove(path)
+                if path.endswith('.jsonl'):
+                    self._saved[year] = 0
+                    self._tails.pop(year, None)
+            # Only once the new file is in place: drop the old format's file
+            self._remove_other_formats(year, path)
+        for year, count in self._saved.items():
+            if year not in self._dirty and len(self._partitions.get(year, ())) > count:
+                self._append(year)
+        for year, expenses in self._pending.items():
+            self._append_unloaded(year, expenses)
+        self._pending.clear()
+        self._dirty.clear()
+
+    def _encode(self, expenses):
+        id_for = self.categories.id_for
+        return [dict(exp, category=id_for(exp['category'])) for exp in expenses]
+
+    def _write(self, year, path, expenses):
+        """Atomically write one partition, compressing it for closed years"""
+        records = self._encode(expenses)
+        # Per-process temp name: a crashed writer never collides with the next one
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            if path.endswith('.xz'):
+                with lzma.open(tmp_path, 'wt', encoding='utf-8') as f:
+                    json.dump(records, f)
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.writelines(json.dumps(record) + '\n' for record in records)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, path)
+        name = os.path.basename(path)
+        st = os.stat(path)
+        self._stamps[name] = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if path.endswith('.jsonl'):
+            last = (json.dumps(records[-1]) + '\n').encode()
+            self._tails[year] = (st.st_ino, st.st_size, last)
+            self._saved[year] = len(records)
+        else:
+            self._saved.pop(year, None)
+            self._tails.pop(year, None)
+
+    def _append(self, year):
+        """Append the year's unsaved records to its journal"""
+        path = self._path(year)
+        expenses = self._partitions[year]
+        lines = [json.dumps(record) + '\n'
+                 for record in self._encode(expenses[self._saved[year]:])]
+        data = ''.join(lines).encode()
+        _, offset, _ = self._tails.get(year, (None, 0, b''))
+        with open(path, 'ab') as f:
+            # Drop a torn line left by a writer that crashed mid-append
+            f.truncate(offset)
+            f.write(data)
+        st = os.stat(path)
+        self._stamps[os.path.basename(path)] = (st.st_ino, st.st_mtime_ns, st.st_size)
+        self._tails[year] = (st.st_ino, offset + len(data), lines[-1].encode())
+        self._saved[year] = len(expenses)
+
+    def _append_unloaded(self, year, expenses):
+        """Append records to a journal this store has not read"""
+        path = self._path(year)
+        data = ''.join(json.dumps(record) + '\n' for record in self._encode(expenses)).encode()
+        end = _complete_length(path) if os.path.exists(path) else 0
+        with open(path, 'ab') as f:
+            # Drop a torn line left by a writer that crashed mid-append
+            f.truncate(end)
+            f.write(data)
+        name = os.path.basename(path)
+        self._stamps[name] = self._stamp(name)
+
+    def refresh(self):
+        """Pick up partitions written by another process.
+
+        Only files whose (inode, mtime, size) changed are read again, and a
+        journal that was only appended to is read from the last offset.
+        Returns ``(new_expenses, rewritten)``: the records appended since the
+        last look, and whether some partition was rewritten in a way that is
+        not a plain append (e.g. data cleared), in which case callers should
+        recompute anything derived from the data.
+        """
+        if self._stamp('categories.json') != self._stamps.get('categories.json'):
+            self.categories = CategoryRegistry(self.registry_file)
+            self._stamps['categories.json'] = self._stamp('categories.json')
+
+        new_expenses = []
+        rewritten = False
+        on_disk = self._files_on_disk()
+        for year in sorted(set(on_disk) | set(self._partitions)):
+            name = on_disk.get(year)
+            known = self._partitions.get(year)
+            unsaved = known is not None and len(known) > self._saved.get(year, len(known))
+            if year in self._dirty or unsaved or (
+                    name is not None and self._stamp(name) == self._stamps.get(name)):
+                continue
+
+            if name is None:
+                # Partition deleted by another process
+                if known:
+                    known.clear()
+                    rewritten = True
+                if year in self._saved:
+                    self._saved[year] = 0
+                    self._tails.pop(year, None)
+                continue
+
+            if known is None and name in self._stamps:
+                # Never loaded here: it will be read fresh when first needed
+                self._stamps[name] = self._stamp(name)
+                continue
+
+            tail = self._tails.get(year)
+            if known is not None and tail is not None and name.endswith('.jsonl'):
+                appended = self._read_journal(year, name, tail)
+                if appended is not None:
+                    new_expenses.extend(appended)
+                    known.extend(appended)
+                    continue
+
+            expenses = self._read_partition(year, name)
+            known = known if known is not None else []
+            if expenses[:len(known)] == known:
+                new_expenses.extend(expenses[len(known):])
+                known.extend(expenses[len(known):])
+            else:
+                known[:] = expenses
+                rewritten = True
+            self._partitions[year] = known
+        return new_expenses, rewritten
+
+    def migrate_categories(self):
+        """One-time re-coding of free-text categories into registry ids"""
+        for year in self.years():
+            self.load_year(year)
+        self.save()
+        self.categories.changed = True
+        self.categories.save()
+
+    def compress_closed_years(self):
+        """Compress partitions of years that have ended.
+
+        Also turns old plain JSON partitions of open years into journals.
+        """
+        for year, name in self._files_on_disk().items():
+            path = self._path(year)
+            if name != os.path.basename(path):
+                self._dirty.add(year)
+                self.load_year(year)
+            else:
+                # Left over from a save interrupted after writing the new file
+                self._remove_other_formats(year, path)
+        self.save()
+
+    def import_legacy_file(self, filename):
+        """Split an old single-file expenses.json into yearly partitions"""
+        if not os.path.exists(filename):
+            return 0
+        with open(filename, 'r', encoding='utf-8') as f:
+            expenses = json.load(f)
+        if not expenses:
+            return 0
+
+        for expense in expenses:
+            self.add(expense)
+        self.save()
+        os.replace(filename, filename + '.bak')
+        return len(expenses)
+
+
+def open_store(filename='expenses.json'):
+    """Open the yearly store that replaces a single expenses.json file"""
+    # expenses.json -> expenses/expenses_<year>.jsonl / .json.xz
+    store = PartitionedExpenseStore(os.path.splitext(filename)[0])
+    if not store.years():
+        with store.locked():
+            if not store.years():
+                store.import_legacy_file(filename)
+    return store
@@ -1,26 +1,36 @@
-import json
-import os
 from datetime import datetime
 import matplotlib.pyplot as plt
 import seaborn as sns
 from collections import defaultdict
+from expense_storage import open_store
 
 class ExpenseTracker:
-    def __init__(self, filename='expenses.json'):
+    def __init__(self, filename='expenses.json', store=None):
         self.filename = filename
-        self.expenses = self.load_expenses()
-        
-    def load_expenses(self):
-        """Load expenses from JSON file"""
-        if os.path.exists(self.filename):
-            with open(self.filename, 'r') as f:
-                return json.load(f)
-        return []
+        self.store = store if store is not None else open_store(filename)
+    
+    @property
+    def expenses(self):
+        """All expenses across every year (loads every partition)"""
+        return self.load_expenses()
+    
+    @expenses.setter
+    def expenses(self, expenses):
+        self.store.replace(expenses)
+        
+    def load_expenses(self, year=None):
+        """Load expenses for one year, or for all years"""
+        if year is not None:
+            return self.store.load_year(year)
+        return self.store.load_all()
     
     def save_expenses(self):
-        """Save expenses to JSON file"""
-        with open(self.filename, 'w') as f:
-            json.dump(self.expenses, f, indent=4)
+        """Save changed yearly partitions"""
+        self.store.save()
+    
+    def refresh(self):
+        """Pick up expenses added by another process since the last look"""
+        return self.store.refresh()
     
     def add_expense(self, amount, category, description, date=None):
         """Add a new expense"""
@@ -34,25 +44,27 @@ class ExpenseTracker:
             'description': description
         }
         
-        self.expenses.append(expense)
-        self.save_expenses()
-        print(f"✓ Expense added: ₹{amount} for {category}")
+        with self.store.locked():
+            self.store.add(expense)
+            self.save_expenses()
+        print(f"✓ Expense added: ₹{amount} for {expense['category']}")
     
     def view_expenses(self, month=None, year=None):
         """View expenses, optionally filtered by month and year"""
-        if not self.expenses:
+        if not self.store.years():
             print("No expenses recorded yet.")
             return
         
-        filtered_expenses = self.expenses
-        
         if month and year:
             filtered_expenses = [
-                exp for exp in self.expenses 
+                exp for exp in self.load_expenses(year) 
                 if datetime.strptime(exp['date'], '%Y-%m-%d').month == month
                 and datetime.strptime(exp['date'], '%Y-%m-%d').year == year
             ]
         
+        else:
+            filtered_expenses = self.load_expenses()
+        
         if not filtered_expenses:
             print(f"No expenses found for {month}/{year}")
             return
@@ -71,10 +83,10 @@ class ExpenseTracker:
         print("="*70 + "\n")
     
     def get_category_totals(self, month=None, year=None):
-        """Get total spending by category"""
+        """Get total spending by category (for a month, a whole year, or everything)"""
         category_totals = defaultdict(float)
         
-        for exp in self.expenses:
+        for exp in self.load_expenses(year):
             exp_date = datetime.strptime(exp['date'], '%Y-%m-%d')
             
             if month and year:
@@ -109,6 +121,8 @@ class ExpenseTracker:
         title = "Expenses by Category"
         if month and year:
             title += f" ({month}/{year})"
+        elif year:
+            title += f" ({year})"
         
         plt.title(title, fontsize=16, fontweight='bold')
         plt.axis('equal')
@@ -124,10 +138,9 @@ class ExpenseTracker:
         
         monthly_totals = defaultdict(float)
         
-        for exp in self.expenses:
+        for exp in self.load_expenses(year):
             exp_date = datetime.strptime(exp['date'], '%Y-%m-%d')
-            if exp_date.year == year:
-                monthly_totals[exp_date.month] += exp['amount']
+            monthly_totals[exp_date.month] += exp['amount']
         
         if not monthly_totals:
             print(f"No expenses found for year {year}.")
@@ -189,6 +202,8 @@ class ExpenseTracker:
         title = 'Expenses by Category'
         if month and year:
             title += f' ({month}/{year})'
+        elif year:
+            title += f' ({year})'
         plt.title(title, fontsize=16, fontweight='bold')
         
         # Add value labels
@@ -212,9 +227,8 @@ class ExpenseTracker:
         
         # Filter expenses for the month
         monthly_expenses = [
-            exp for exp in self.expenses 
+            exp for exp in self.load_expenses(year) 
             if datetime.strptime(exp['date'], '%Y-%m-%d').month == month
-            and datetime.strptime(exp['date'], '%Y-%m-%d').year == year
         ]
         
         if not monthly_expenses:
@@ -246,12 +260,13 @@ class ExpenseTracker:
     
     def clear_all_data(self):
         """Clear all expense data with confirmation"""
-        if not self.expenses:
+        expenses = self.expenses
+        if not expenses:
             print("\n⚠ No data to clear. The expense tracker is already empty.")
             return
         
-        total_expenses = len(self.expenses)
-        total_amount = sum(exp['amount'] for exp in self.expenses)
+        total_expenses = len(expenses)
+        total_amount = sum(exp['amount'] for exp in expenses)
         
         print(f"\n{'='*70}")
         print("⚠️  WARNING: CLEAR ALL DATA".center(70))
@@ -265,8 +280,9 @@ class ExpenseTracker:
         confirmation = input("Type 'DELETE ALL' to confirm (or anything else to cancel): ").strip()
         
         if confirmation == 'DELETE ALL':
-            self.expenses = []
-            self.save_expenses()
+            with self.store.locked():
+                self.expenses = []
+                self.save_expenses()
             print("\n✓ All expense data has been cleared successfully.")
             print("  You can start fresh by adding new expenses.\n")
         else:
@@ -276,11 +292,6 @@ class ExpenseTracker:
 def main():
     tracker = ExpenseTracker()
     
-    # Indian expense categories
-    categories = ['Food & Groceries', 'Transportation', 'Entertainment', 'Utilities & Bills', 
-                  'Healthcare', 'Shopping & Clothing', 'Education', 'Rent', 
-                  'Mobile & Internet', 'Personal Care', 'Other']
-    
     while True:
         print("\n" + "="*50)
         print("PERSONAL EXPENSE TRACKER".center(50))
@@ -298,9 +309,9 @@ def main():
         choice = input("\nEnter your choice (1-8): ").strip()
         
         if choice == '1':
-            print("\nCategories:", ", ".join(categories))
+            print("\nCategories:", ", ".join(tracker.store.categories.names))
             amount = input("Enter amount: ₹")
-            category = input("Enter category: ").strip().capitalize()
+            category = input("Enter category: ").strip()
             description = input("Enter description: ").strip()
             date = input("Enter date (YYYY-MM-DD) or press Enter for today: ").strip()
             
@@ -0,0 +1,75 @@
+"""
+Live view of the expense data for long-running reports and dashboards.
+
+ExpenseWatcher polls the yearly partition files (inode, mtime and size only)
+and, when another process adds expenses, reads just the lines appended to the
+current year's journal. Those records are fed into the store's in-memory data
+(shared with the ExpenseTracker using it) and into running totals.
+
+    tracker = ExpenseTracker()
+    watcher = ExpenseWatcher(tracker.store)
+    watcher.watch(lambda new, totals: print(totals.category_totals))
+"""
+
+import time
+from collections import defaultdict
+
+
+class LiveTotals:
+    """Running totals by category and by month, updated one record at a time"""
+
+    def __init__(self, expenses=()):
+        self.reset(expenses)
+
+    def reset(self, expenses=()):
+        """Recompute every total from scratch"""
+        self.count = 0
+        self.total = 0.0
+        self.category_totals = defaultdict(float)
+        self.monthly_totals = defaultdict(float)
+        self.add_all(expenses)
+
+    def add_all(self, expenses):
+        for exp in expenses:
+            self.count += 1
+            self.total += exp['amount']
+            self.category_totals[exp['category']] += exp['amount']
+            self.monthly_totals[exp['date'][:7]] += exp['amount']
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'total': round(self.total, 2),
+            'by_category': {k: round(v, 2) for k, v in sorted(self.category_totals.items())},
+            'by_month': {k: round(v, 2) for k, v in sorted(self.monthly_totals.items())},
+        }
+
+
+class ExpenseWatcher:
+    """Keep an expense store and its totals current with changes on disk"""
+
+    def __init__(self, store, interval=0.5):
+        self.store = store
+        self.interval = interval
+        self.totals = LiveTotals(store.load_all())
+        self.changed = False
+
+    def poll(self):
+        """Check the files once; return the expenses added since the last poll"""
+        new_expenses, rewritten = self.store.refresh()
+        self.changed = bool(new_expenses) or rewritten
+        if rewritten:
+            self.totals.reset(self.store.load_all())
+        else:
+            self.totals.add_all(new_expenses)
+        return new_expenses
+
+    def watch(self, on_change=None, max_polls=None):
+        """Poll every ``interval`` seconds, calling ``on_change(new, totals)``"""
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            new_expenses = self.poll()
+            if on_change is not None and self.changed:
+                on_change(new_expenses, self.totals)
+            polls += 1
+            time.sleep(self.interval)